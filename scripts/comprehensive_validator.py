@@ -20,6 +20,8 @@ import ipaddress
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from universal_m3u_parser import ParsedChannel
+
 class ValidationLevel(Enum):
     """Validation strictness levels"""
     BASIC = "basic"          # Format validation only
@@ -201,16 +203,19 @@ class ComprehensiveM3UValidator:
             'NL': [r'\bnetherlands?\b', r'\bdutch\b', r'\bholland\b']
         }
     
-    async def validate_playlist(self, content: Union[str, List[str]]) -> ValidationReport:
+    async def validate_playlist(self, content: Union[str, List[str]],
+                                validation_level: Optional[ValidationLevel] = None) -> ValidationReport:
         """
         Main validation method for M3U playlists
         
         Args:
             content: M3U content as string or list of lines
+            validation_level: Level for this call only (default: the validator's level)
             
         Returns:
             Comprehensive validation report
         """
+        level = validation_level or self.validation_level
         start_time = time.time()
         
         # Normalize input
@@ -221,14 +226,62 @@ class ComprehensiveM3UValidator:
         
         # Initialize report
         issues = []
-        stream_health = []
         statistics = self._initialize_statistics()
         
         # Parse channels
-        channels = self._parse_channels(lines, issues, statistics)
+        channels = self._parse_channels(lines, issues, statistics, level)
+        
+        missing_header = bool(lines) and not lines[0].upper().startswith('#EXTM3U')
+        return await self._build_report(channels, missing_header, issues, statistics, level, start_time)
+    
+    async def validate_channels(self, channels: List[ParsedChannel],
+                                validation_level: Optional[ValidationLevel] = None) -> ValidationReport:
+        """
+        Validate already-parsed channels without rendering or re-parsing text
+        
+        The report matches validate_playlist() on the playlist the channels
+        render to (an #EXTM3U header, then each channel's EXTINF and URL line).
+        
+        Args:
+            channels: Parsed channels, e.g. from UniversalM3UParser
+            validation_level: Level for this call only (default: the validator's level)
+            
+        Returns:
+            Comprehensive validation report
+        """
+        level = validation_level or self.validation_level
+        start_time = time.time()
+        
+        issues = []
+        statistics = self._initialize_statistics()
+        entries = []
+        
+        # Line 1 is the #EXTM3U header; blank URLs take no line, as in the text path
+        line_num = 1
+        for channel in channels:
+            line_num += 1
+            extinf = {'line_num': line_num, 'extinf': channel.extinf_line().strip()}
+            statistics['extinf_lines'] += 1
+            
+            url = channel.url.strip()
+            if not url:
+                continue
+            line_num += 1
+            
+            if self._looks_like_url(url):
+                self._add_channel(url, line_num, extinf, entries, issues, statistics, level)
+        
+        statistics['total_channels'] = len(entries)
+        return await self._build_report(entries, False, issues, statistics, level, start_time)
+    
+    async def _build_report(self, channels: List[Dict[str, Any]], missing_header: bool,
+                            issues: List[ValidationIssue], statistics: Dict[str, Any],
+                            level: ValidationLevel, start_time: float) -> ValidationReport:
+        """Run the playlist-wide checks on parsed channels and assemble the report"""
+        stream_health = []
         
         # Validate format structure
-        self._validate_format_structure(lines, channels, issues, statistics)
+        self._validate_format_structure(missing_header, channels, issues, statistics, level)
         
         # Validate individual channels
         await self._validate_channels(channels, issues, statistics)
@@ -246,13 +299,13 @@ class ComprehensiveM3UValidator:
         
         # Determine overall validity
         error_count = len([i for i in issues if i.type == IssueType.ERROR])
-        valid = error_count == 0 or self.validation_level == ValidationLevel.PERMISSIVE
+        valid = error_count == 0 or level == ValidationLevel.PERMISSIVE
         
         processing_time = time.time() - start_time
         
         return ValidationReport(
             valid=valid,
-            validation_level=self.validation_level,
+            validation_level=level,
             total_channels=len(channels),
             valid_channels=statistics['valid_channels'],
             issues=issues,
@@ -263,13 +316,15 @@ class ComprehensiveM3UValidator:
             processing_time=processing_time
         )
     
-    def validate_url(self, url: str, allow_custom_protocols: bool = True) -> Tuple[bool, List[str]]:
+    def validate_url(self, url: str, allow_custom_protocols: bool = True,
+                     validation_level: Optional[ValidationLevel] = None) -> Tuple[bool, List[str]]:
         """
         Flexible URL validation supporting all streaming protocols
         
         Args:
             url: URL to validate
             allow_custom_protocols: Whether to allow non-standard protocols
+            validation_level: Level for this call only (default: the validator's level)
             
         Returns:
             Tuple of (is_valid, list_of_issues)
@@ -277,6 +332,8 @@ class ComprehensiveM3UValidator:
         if not url or not url.strip():
             return False, ["Empty URL"]
         
+        level = validation_level or self.validation_level
+        
         url = url.strip()
         issues = []
         
@@ -284,7 +341,7 @@ class ComprehensiveM3UValidator:
             # Basic format check
             if len(url) > 2048:
                 issues.append("URL exceeds maximum length (2048 characters)")
-                if self.validation_level == ValidationLevel.STRICT:
+                if level == ValidationLevel.STRICT:
                     return False, issues
             
             # Parse URL
@@ -299,7 +356,7 @@ class ComprehensiveM3UValidator:
                 protocol_valid, protocol_issues = self._validate_protocol_specific(url, protocol_category, parsed)
                 issues.extend(protocol_issues)
                 
-                if not protocol_valid and self.validation_level == ValidationLevel.STRICT:
+                if not protocol_valid and level == ValidationLevel.STRICT:
                     return False, issues
                     
             elif allow_custom_protocols and parsed.scheme:
@@ -315,10 +372,10 @@ class ComprehensiveM3UValidator:
             
             # Host validation (if applicable)
             if parsed.netloc:
-                host_valid, host_issues = self._validate_host(parsed.netloc)
+                host_valid, host_issues = self._validate_host(parsed.netloc, level)
                 issues.extend(host_issues)
                 
-                if not host_valid and self.validation_level == ValidationLevel.STRICT:
+                if not host_valid and level == ValidationLevel.STRICT:
                     return False, issues
             
             # Path validation
@@ -334,11 +391,11 @@ class ComprehensiveM3UValidator:
             # Determine validity based on validation level
             error_count = len([i for i in issues if "Invalid" in i or "missing" in i.lower()])
             
-            if self.validation_level == ValidationLevel.PERMISSIVE:
+            if level == ValidationLevel.PERMISSIVE:
                 return True, issues  # Always valid in permissive mode
-            elif self.validation_level == ValidationLevel.BASIC:
+            elif level == ValidationLevel.BASIC:
                 return error_count == 0, issues
-            elif self.validation_level == ValidationLevel.STANDARD:
+            elif level == ValidationLevel.STANDARD:
                 return error_count == 0, issues
             else:  # STRICT
                 return len(issues) == 0, issues
@@ -411,7 +468,7 @@ class ComprehensiveM3UValidator:
         
         return True, issues
     
-    def _validate_host(self, netloc: str) -> Tuple[bool, List[str]]:
+    def _validate_host(self, netloc: str, level: ValidationLevel) -> Tuple[bool, List[str]]:
         """Validate hostname/IP in URL"""
         issues = []
         
@@ -438,7 +495,7 @@ class ComprehensiveM3UValidator:
         # Check if it's an IP address
         try:
             ip = ipaddress.ip_address(hostname)
-            if ip.is_loopback and self.validation_level == ValidationLevel.STRICT:
+            if ip.is_loopback and level == ValidationLevel.STRICT:
                 issues.append("Loopback IP address may not be accessible externally")
             elif ip.is_private:
                 issues.append("Private IP address may not be accessible externally")
@@ -662,7 +719,8 @@ class ComprehensiveM3UValidator:
         
         return health
     
-    def _parse_channels(self, lines: List[str], issues: List[ValidationIssue], statistics: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _parse_channels(self, lines: List[str], issues: List[ValidationIssue], statistics: Dict[str, Any],
+                        level: ValidationLevel) -> List[Dict[str, Any]]:
         """Parse channels from M3U lines"""
         channels = []
         current_extinf = None
@@ -675,37 +733,43 @@ class ComprehensiveM3UValidator:
                 statistics['extinf_lines'] += 1
                 
             elif self._looks_like_url(line):
-                url_valid, url_issues = self.validate_url(line)
-                
-                channel = {
-                    'url': line,
-                    'line_num': line_num,
-                    'extinf_data': current_extinf,
-                    'valid': url_valid
-                }
-                
-                # Add URL validation issues
-                for issue_msg in url_issues:
-                    issue_type = IssueType.ERROR if not url_valid else IssueType.WARNING
-                    issues.append(ValidationIssue(
-                        type=issue_type,
-                        category='url_validation',
-                        message=issue_msg,
-                        line_number=line_num,
-                        url=line
-                    ))
-                
-                if url_valid:
-                    statistics['valid_channels'] += 1
-                else:
-                    statistics['invalid_channels'] += 1
-                
-                channels.append(channel)
+                self._add_channel(line, line_num, current_extinf, channels, issues, statistics, level)
                 current_extinf = None
                 
         statistics['total_channels'] = len(channels)
         return channels
     
+    def _add_channel(self, url: str, line_num: int, extinf_data: Optional[Dict[str, Any]],
+                     channels: List[Dict[str, Any]], issues: List[ValidationIssue],
+                     statistics: Dict[str, Any], level: ValidationLevel) -> None:
+        """Validate one channel URL and record it with its EXTINF data"""
+        url_valid, url_issues = self.validate_url(url, validation_level=level)
+        
+        channel = {
+            'url': url,
+            'line_num': line_num,
+            'extinf_data': extinf_data,
+            'valid': url_valid
+        }
+        
+        # Add URL validation issues
+        for issue_msg in url_issues:
+            issue_type = IssueType.ERROR if not url_valid else IssueType.WARNING
+            issues.append(ValidationIssue(
+                type=issue_type,
+                category='url_validation',
+                message=issue_msg,
+                line_number=line_num,
+                url=url
+            ))
+        
+        if url_valid:
+            statistics['valid_channels'] += 1
+        else:
+            statistics['invalid_channels'] += 1
+        
+        channels.append(channel)
+    
     def _looks_like_url(self, line: str) -> bool:
         """Check if line looks like a URL"""
         if not line:
@@ -726,13 +790,14 @@ class ComprehensiveM3UValidator:
         
         return False
     
-    def _validate_format_structure(self, lines: List[str], channels: List[Dict[str, Any]], 
-                                 issues: List[ValidationIssue], statistics: Dict[str, Any]) -> None:
+    def _validate_format_structure(self, missing_header: bool, channels: List[Dict[str, Any]], 
+                                 issues: List[ValidationIssue], statistics: Dict[str, Any],
+                                 level: ValidationLevel) -> None:
         """Validate M3U format structure"""
         
         # Check for M3U header
-        if lines and not lines[0].upper().startswith('#EXTM3U'):
-            if self.validation_level != ValidationLevel.PERMISSIVE:
+        if missing_header:
+            if level != ValidationLevel.PERMISSIVE:
                 issues.append(ValidationIssue(
                     type=IssueType.WARNING,
                     category='format_structure',
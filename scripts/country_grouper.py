@@ -9,37 +9,45 @@ except ImportError:
 import re
 from typing import Optional, Dict, List
 
+# One alternation per country code, so each country costs a single search
+COUNTRY_PATTERNS = {
+    'US': r'\b(usa?|united states|american?|us)\b',
+    'UK': r'\b(uk|united kingdom|british?|gb)\b',
+    'CA': r'\b(canada|canadian?|ca)\b',
+    'DE': r'\b(germany|german|deutschland|de)\b',
+    'FR': r'\b(france|french|français|fr)\b',
+    'ES': r'\b(spain|spanish|españa|es)\b',
+    'IT': r'\b(italy|italian|italia|it)\b',
+    'BR': r'\b(brazil|brazilian|brasil|br)\b',
+    'MX': r'\b(mexico|mexican|méxico|mx)\b',
+    'IN': r'\b(india|indian|in)\b',
+    'AU': r'\b(australia|australian|aussie|au)\b',
+    'NL': r'\b(netherlands|dutch|holland|nl)\b',
+    'TR': r'\b(turkey|turkish|türkiye|tr)\b',
+    'AR': r'\b(argentina|argentinian|ar)\b',
+    'RU': r'\b(russia|russian|ru)\b',
+    'HR': r'\b(croatia|croatian|hrvatska|hr)\b'
+}
+
+# All countries fused into one regex, compiled once at import. Each country
+# sits in its own lookahead and the alternatives are tried in
+# COUNTRY_PATTERNS order, so a single match() keeps first-country-wins
+# priority and lastgroup names the winning code.
+_COUNTRY_REGEX = re.compile(
+    '|'.join(f'(?=.*?(?P<{code}>{pattern}))' for code, pattern in COUNTRY_PATTERNS.items()),
+    re.IGNORECASE | re.DOTALL
+)
+
 class CountryGrouper:
     def __init__(self):
-        self.country_patterns = {
-            'US': [r'\b(usa?|united states|american?)\b', r'\bus\b'],
-            'UK': [r'\b(uk|united kingdom|british?)\b', r'\bgb\b'],
-            'CA': [r'\b(canada|canadian?)\b', r'\bca\b'],
-            'DE': [r'\b(germany|german|deutschland)\b', r'\bde\b'],
-            'FR': [r'\b(france|french|français)\b', r'\bfr\b'],
-            'ES': [r'\b(spain|spanish|españa)\b', r'\bes\b'],
-            'IT': [r'\b(italy|italian|italia)\b', r'\bit\b'],
-            'BR': [r'\b(brazil|brazilian|brasil)\b', r'\bbr\b'],
-            'MX': [r'\b(mexico|mexican|méxico)\b', r'\bmx\b'],
-            'IN': [r'\b(india|indian)\b', r'\bin\b'],
-            'AU': [r'\b(australia|australian|aussie)\b', r'\bau\b'],
-            'NL': [r'\b(netherlands|dutch|holland)\b', r'\bnl\b'],
-            'TR': [r'\b(turkey|turkish|türkiye)\b', r'\btr\b'],
-            'AR': [r'\b(argentina|argentinian)\b', r'\bar\b'],
-            'RU': [r'\b(russia|russian)\b', r'\bru\b'],
-            'HR': [r'\b(croatia|croatian|hrvatska)\b', r'\bhr\b']
-        }
+        self.country_regex = _COUNTRY_REGEX
 
     def detect_country(self, name: str, group: str = "") -> Optional[str]:
         """Detect country from channel name and group"""
         text = f"{name} {group}".lower()
         
-        for country_code, patterns in self.country_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return country_code
-        
-        return None
+        match = self.country_regex.match(text)
+        return match.lastgroup if match else None
 
     def group_by_country(self, channels: List[Dict]) -> Dict[str, List[Dict]]:
         """Group channels by detected country"""
@@ -5,7 +5,6 @@ Handles importing and validating M3U playlists
 """
 
 import requests
-import re
 import os
 import sys
 from urllib.parse import urlparse
@@ -55,21 +54,30 @@ def parse_extinf_line(line):
         channel['name'] = line.split(',', 1)[1].strip()
     
     # Extract attributes
-    logo_match = re.search(r'tvg-logo="([^"]*)"', line)
-    if logo_match:
-        channel['logo'] = logo_match.group(1)
+    logo = extract_attribute(line, 'tvg-logo')
+    if logo is not None:
+        channel['logo'] = logo
     
-    epg_match = re.search(r'tvg-id="([^"]*)"', line)
-    if epg_match:
-        channel['epg'] = epg_match.group(1)
+    epg = extract_attribute(line, 'tvg-id')
+    if epg is not None:
+        channel['epg'] = epg
     
-    group_match = re.search(r'group-title="([^"]*)"', line)
-    if group_match:
-        channel['group'] = group_match.group(1)
+    group = extract_attribute(line, 'group-title')
+    if group is not None:
+        channel['group'] = group
     
     return channel
 
 
+def extract_attribute(line, name):
+    """Return the value of name="..." in line, or None if it is absent or unterminated"""
+    _, sep, tail = line.partition(f'{name}="')
+    if not sep:
+        return None
+    value, sep, _ = tail.partition('"')
+    return value if sep else None
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         url = sys.argv[1]
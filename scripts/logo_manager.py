@@ -6,11 +6,82 @@ Handles channel logo detection and assignment
 
 import requests
 import re
+import os
+import json
+import time
+from functools import lru_cache
 from urllib.parse import urlparse, urljoin
 
 
+# Resolved logos persisted between workflow runs
+LOGO_CACHE_FILE = os.path.join('reports', 'logo_cache.json')
+LOGO_CACHE_TTL = 7 * 24 * 3600  # seconds
+
+_logo_cache = None
+_logo_cache_dirty = False
+
+
+def load_logo_cache(cache_file=LOGO_CACHE_FILE, ttl=LOGO_CACHE_TTL):
+    """Load the on-disk logo cache, dropping entries older than ttl"""
+    global _logo_cache, _logo_cache_dirty
+    
+    cache = {}
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    
+    now = time.time()
+    fresh = {
+        key: entry for key, entry in cache.items()
+        if isinstance(entry, dict) and now - entry.get('ts', 0) < ttl
+    }
+    
+    _logo_cache = fresh
+    _logo_cache_dirty = len(fresh) != len(cache)
+    return _logo_cache
+
+
+def save_logo_cache(cache_file=LOGO_CACHE_FILE):
+    """Persist the logo cache if it changed during this run"""
+    global _logo_cache_dirty
+    
+    if _logo_cache is None or not _logo_cache_dirty:
+        return False
+    
+    try:
+        os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(_logo_cache, f, indent=2)
+        _logo_cache_dirty = False
+        return True
+    except OSError as e:
+        print(f"Could not save logo cache: {e}")
+        return False
+
+
 def get_channel_logo(channel_name, channel_url=None):
-    """Get logo URL for a channel"""
+    """Get logo URL for a channel, using the persistent logo cache"""
+    global _logo_cache_dirty
+    
+    if _logo_cache is None:
+        load_logo_cache()
+    
+    cache_key = f"{channel_name}\t{channel_url or ''}"
+    entry = _logo_cache.get(cache_key)
+    if entry is not None:
+        return entry.get('logo')
+    
+    logo_url = _resolve_channel_logo(channel_name, channel_url)
+    _logo_cache[cache_key] = {'logo': logo_url, 'ts': int(time.time())}
+    _logo_cache_dirty = True
+    return logo_url
+
+
+@lru_cache(maxsize=4096)
+def _resolve_channel_logo(channel_name, channel_url=None):
+    """Match a channel against the predefined logo mappings"""
     
     # Predefined logo mappings
     logo_mappings = {
@@ -86,6 +157,7 @@ def assign_logos_to_channels(channels):
                 channel['logo'] = logo_url
                 assigned += 1
     
+    save_logo_cache()
     print(f"Assigned logos to {assigned} channels")
     return channels
 
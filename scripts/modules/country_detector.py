@@ -2,10 +2,18 @@
 """
 M3U Country Grouper - Fixed Version
 Groups channels by country based on various detection methods
-No external dependencies required
+No external dependencies required (pyahocorasick is used when available)
 """
 
+import os
 import re
+from collections import defaultdict, deque
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 
 # Built-in country mapping to avoid pycountry dependency
@@ -39,78 +47,184 @@ COUNTRY_MAP = {
     'AL': 'Albania'
 }
 
+# Group title assigned to channels of each detected country
+COUNTRY_GROUP_LABELS = {code: f"{name} Channels" for code, name in COUNTRY_MAP.items()}
 
-def detect_country_from_channel(channel_info):
-    """Detect country from channel information"""
-    name = channel_info.get('name', '').lower()
-    group = channel_info.get('group', '').lower()
-    url = channel_info.get('url', '').lower()
+
+# Country patterns - enhanced for Albania
+COUNTRY_PATTERNS = {
+    'AL': ['albania', 'albanian', 'tirana', 'rtk', 'tv klan', 'top channel'],
+    'US': ['usa', 'america', 'cnn', 'fox', 'nbc', 'abc', 'cbs'],
+    'GB': ['uk', 'britain', 'british', 'bbc', 'itv', 'sky'],
+    'FR': ['france', 'french', 'tf1', 'canal+'],
+    'DE': ['germany', 'german', 'deutschland', 'ard', 'zdf'],
+    'IT': ['italy', 'italian', 'italia', 'rai'],
+    'ES': ['spain', 'spanish', 'espana', 'tve'],
+    'PT': ['portugal', 'portuguese', 'rtp'],
+    'NL': ['netherlands', 'dutch', 'npo'],
+    'BE': ['belgium', 'belgian', 'vrt'],
+    'SE': ['sweden', 'swedish', 'svt'],
+    'NO': ['norway', 'norwegian', 'nrk'],
+    'DK': ['denmark', 'danish', 'dr'],
+    'FI': ['finland', 'finnish', 'yle'],
+    'PL': ['poland', 'polish', 'tvp'],
+    'RU': ['russia', 'russian', 'rossiya'],
+    'TR': ['turkey', 'turkish', 'trt'],
+    'GR': ['greece', 'greek', 'ert'],
+    'IN': ['india', 'indian', 'zee', 'star'],
+    'CN': ['china', 'chinese', 'cctv'],
+    'JP': ['japan', 'japanese', 'nhk'],
+    'KR': ['korea', 'korean', 'kbs'],
+    'AU': ['australia', 'australian', 'abc'],
+    'CA': ['canada', 'canadian', 'cbc'],
+    'BR': ['brazil', 'brazilian', 'globo'],
+    'MX': ['mexico', 'mexican', 'televisa'],
+    'AR': ['argentina', 'argentine', 'telefe']
+}
+
+
+class _PatternMatcher:
+    """Pure-Python Aho-Corasick automaton used when pyahocorasick is missing"""
     
-    # Country patterns - enhanced for Albania
-    country_patterns = {
-        'AL': ['albania', 'albanian', 'tirana', 'rtk', 'tv klan', 'top channel'],
-        'US': ['usa', 'america', 'cnn', 'fox', 'nbc', 'abc', 'cbs'],
-        'GB': ['uk', 'britain', 'british', 'bbc', 'itv', 'sky'],
-        'FR': ['france', 'french', 'tf1', 'canal+'],
-        'DE': ['germany', 'german', 'deutschland', 'ard', 'zdf'],
-        'IT': ['italy', 'italian', 'italia', 'rai'],
-        'ES': ['spain', 'spanish', 'espana', 'tve'],
-        'PT': ['portugal', 'portuguese', 'rtp'],
-        'NL': ['netherlands', 'dutch', 'npo'],
-        'BE': ['belgium', 'belgian', 'vrt'],
-        'SE': ['sweden', 'swedish', 'svt'],
-        'NO': ['norway', 'norwegian', 'nrk'],
-        'DK': ['denmark', 'danish', 'dr'],
-        'FI': ['finland', 'finnish', 'yle'],
-        'PL': ['poland', 'polish', 'tvp'],
-        'RU': ['russia', 'russian', 'rossiya'],
-        'TR': ['turkey', 'turkish', 'trt'],
-        'GR': ['greece', 'greek', 'ert'],
-        'IN': ['india', 'indian', 'zee', 'star'],
-        'CN': ['china', 'chinese', 'cctv'],
-        'JP': ['japan', 'japanese', 'nhk'],
-        'KR': ['korea', 'korean', 'kbs'],
-        'AU': ['australia', 'australian', 'abc'],
-        'CA': ['canada', 'canadian', 'cbc'],
-        'BR': ['brazil', 'brazilian', 'globo'],
-        'MX': ['mexico', 'mexican', 'televisa'],
-        'AR': ['argentina', 'argentine', 'telefe']
-    }
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
     
-    # Check all text fields for country patterns
-    all_text = f"{name} {group} {url}"
+    def add_word(self, word, value):
+        node = 0
+        for char in word:
+            next_node = self.goto[node].get(char)
+            if next_node is None:
+                next_node = len(self.goto)
+                self.goto[node][char] = next_node
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            node = next_node
+        self.output[node].append((len(word), value))
     
-    for country_code, patterns in country_patterns.items():
+    def make_automaton(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+    
+    def iter(self, text):
+        goto, fail, output = self.goto, self.fail, self.output
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for _, value in output[node]:
+                yield index, value
+
+
+def _build_country_automaton():
+    """Build one automaton over every country pattern and country code.
+    
+    Values are (rank, country_code, length) so that, when several patterns
+    hit, the earliest entry in COUNTRY_PATTERNS wins just like the old nested
+    scan, and the hit can be checked for word boundaries. Also returns the
+    set of first characters of all patterns for a fast reject test.
+    """
+    words = {}
+    for country_code, patterns in COUNTRY_PATTERNS.items():
         for pattern in patterns:
-            if pattern in all_text:
-                return country_code
+            words.setdefault(pattern.lower(), (len(words), country_code, len(pattern)))
+    for country_code in COUNTRY_MAP:
+        words.setdefault(country_code.lower(), (len(words), country_code, len(country_code)))
+    
+    automaton = ahocorasick.Automaton() if ahocorasick else _PatternMatcher()
+    for word, value in words.items():
+        automaton.add_word(word, value)
+    automaton.make_automaton()
+    
+    first_chars = frozenset(word[0] for word in words)
+    return automaton, first_chars
+
+
+# First characters of every pattern; text containing none of them cannot match
+_AUTOMATON, _FIRST_CHARS = _build_country_automaton()
+
+
+def _is_whole_word(text, start, end):
+    """Check that text[start:end] is not part of a longer alphanumeric word"""
+    if start > 0 and text[start - 1].isalnum() and text[start].isalnum():
+        return False
+    if end < len(text) and text[end].isalnum() and text[end - 1].isalnum():
+        return False
+    return True
+
+# Number of distinct (name, group, url) lookups remembered per run
+COUNTRY_CACHE_SIZE = int(os.environ.get('M3U_COUNTRY_CACHE', 8192))
+
+
+def detect_country_from_channel(channel_info):
+    """Detect country from channel information"""
+    return _detect_country_cached(
+        channel_info.get('name', '').lower(),
+        channel_info.get('group', '').lower(),
+        channel_info.get('url', '').lower()
+    )
+
+
+def _best_country_hit(text, best=None):
+    """Return the highest-priority whole-word hit in text (or best if better)"""
+    # Cheap C-level reject before walking the automaton
+    if _FIRST_CHARS.isdisjoint(text):
+        return best
     
-    # Check for country codes in text
-    for country_code in COUNTRY_MAP.keys():
-        if country_code.lower() in all_text:
-            return country_code
+    # Only whole-word hits count, so 'dr' no longer matches 'drama'
+    for end_index, hit in _AUTOMATON.iter(text):
+        if best is not None and hit >= best:
+            continue
+        end = end_index + 1
+        if not _is_whole_word(text, end - hit[2], end):
+            continue
+        best = hit
+        if hit[0] == 0:
+            break
     
-    return 'Unknown'
+    return best
+
+
+@lru_cache(maxsize=COUNTRY_CACHE_SIZE)
+def _detect_country_cached(name, group, url):
+    """Detect country from already lowercased name, group and url"""
+    # Scan each field on its own instead of building one joined string
+    best = None
+    for text in (name, group, url):
+        if text:
+            best = _best_country_hit(text, best)
+            if best is not None and best[0] == 0:
+                break
+    
+    return best[1] if best else 'Unknown'
 
 
 def group_channels_by_country(channels):
     """Group channels by detected country"""
-    grouped = {}
+    grouped = defaultdict(list)
     
     for channel in channels:
         country = detect_country_from_channel(channel)
         
-        if country not in grouped:
-            grouped[country] = []
-        
         # Update channel group
-        if country != 'Unknown':
-            country_name = COUNTRY_MAP.get(country, country)
-            channel['group'] = f"{country_name} Channels"
+        label = COUNTRY_GROUP_LABELS.get(country)
+        if label:
+            channel['group'] = label
         
         grouped[country].append(channel)
     
-    return grouped
+    return dict(grouped)
 
 
 if __name__ == "__main__":
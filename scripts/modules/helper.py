@@ -6,11 +6,59 @@ Common helper functions for M3U processing
 
 import re
 import os
+import asyncio
 import requests
 import logging
+from collections import Counter
+from itertools import chain
+from functools import lru_cache
 from urllib.parse import urlparse
 from datetime import datetime
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+# EXTINF attributes extracted in a single scan, mapped to channel fields
+_EXTINF_ATTR_RE = re.compile(
+    r'(?P<key>tvg-logo|tvg-id|group-title|tvg-language|tvg-country)="(?P<value>[^"]*)"'
+)
+_EXTINF_ATTR_FIELDS = {
+    'tvg-logo': 'logo',
+    'tvg-id': 'epg',
+    'group-title': 'group',
+    'tvg-language': 'language',
+    'tvg-country': 'country'
+}
+
+# Characters that are unsafe in file names, replaced by clean_filename
+_FILENAME_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Units used by get_file_size
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Shared HTTP session so repeated URL checks reuse TCP/TLS connections. The
+# per-host pool is sized for threaded callers; requests' default of 10
+# would drop and reopen connections once more threads share a host
+HTTP_POOL_SIZE = 32
+_http_session = requests.Session()
+_http_adapter = requests.adapters.HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+_http_session.mount('http://', _http_adapter)
+_http_session.mount('https://', _http_adapter)
+
+# Channel name normalization: strip non-word characters, collapse whitespace
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_ASCII_NON_WORD_TABLE = str.maketrans(
+    '', '', ''.join(c for c in map(chr, range(128)) if _NON_WORD_RE.match(c))
+)
 
 def setup_logging():
     """Setup logging configuration"""
@@ -26,19 +74,21 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
 def normalize_channel_name(name):
     """Normalize channel name for comparison and matching"""
     if not name:
         return ""
     
-    # Remove special characters but keep spaces
-    normalized = re.sub(r'[^\w\s]', '', name)
+    # Remove special characters but keep spaces (table lookup for ASCII names)
+    if name.isascii():
+        normalized = name.translate(_ASCII_NON_WORD_TABLE)
+    else:
+        normalized = _NON_WORD_RE.sub('', name)
     # Convert to lowercase and strip whitespace
     normalized = normalized.lower().strip()
     # Replace multiple spaces with single space
-    normalized = re.sub(r'\s+', ' ', normalized)
-    
-    return normalized
+    return _WHITESPACE_RE.sub(' ', normalized)
 
 
 def extract_channel_info(extinf_line):
@@ -53,22 +103,17 @@ def extract_channel_info(extinf_line):
     }
     
     # Extract channel name (after the comma)
-    if ',' in extinf_line:
-        info['name'] = extinf_line.split(',', 1)[1].strip()
-    
-    # Extract attributes using regex
-    attributes = [
-        ('logo', r'tvg-logo="([^"]*)"'),
-        ('epg', r'tvg-id="([^"]*)"'),
-        ('group', r'group-title="([^"]*)"'),
-        ('language', r'tvg-language="([^"]*)"'),
-        ('country', r'tvg-country="([^"]*)"')
-    ]
+    _, comma, name = extinf_line.partition(',')
+    if comma:
+        info['name'] = name.strip()
     
-    for attr, pattern in attributes:
-        match = re.search(pattern, extinf_line)
-        if match:
-            info[attr] = match.group(1)
+    # Extract all attributes in one pass; the first occurrence of each wins
+    found = set()
+    for match in _EXTINF_ATTR_RE.finditer(extinf_line):
+        key = match.group('key')
+        if key not in found:
+            found.add(key)
+            info[_EXTINF_ATTR_FIELDS[key]] = match.group('value')
     
     return info
 
@@ -76,18 +121,49 @@ def extract_channel_info(extinf_line):
 def validate_url(url, timeout=10):
     """Validate if a URL is accessible"""
     try:
-        response = requests.head(url, timeout=timeout, allow_redirects=True)
+        response = _http_session.head(url, timeout=timeout, allow_redirects=True)
         return response.status_code == 200
-    except:
+    except requests.RequestException:
         return False
 
 
+async def validate_urls(urls, timeout=10, concurrency=64):
+    """Validate many URLs concurrently, returning {url: is_accessible}"""
+    urls = list(dict.fromkeys(urls))
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    if aiohttp is None:
+        # No aiohttp: run the synchronous checks in worker threads instead
+        loop = asyncio.get_running_loop()
+        
+        async def check(url):
+            async with semaphore:
+                return await loop.run_in_executor(None, validate_url, url, timeout)
+        
+        results = await asyncio.gather(*(check(url) for url in urls))
+        return dict(zip(urls, results))
+    
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    
+    async with aiohttp.ClientSession(timeout=client_timeout, connector=connector) as session:
+        async def check(url):
+            async with semaphore:
+                try:
+                    async with session.head(url, allow_redirects=True) as response:
+                        return response.status == 200
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                    return False
+        
+        results = await asyncio.gather(*(check(url) for url in urls))
+    
+    return dict(zip(urls, results))
+
+
 def clean_filename(filename):
     """Clean filename for safe file system usage"""
-    # Remove or replace invalid characters
-    cleaned = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    # Remove leading/trailing dots and spaces
-    cleaned = cleaned.strip('. ')
+    # Replace invalid characters and remove leading/trailing dots and spaces
+    cleaned = filename.translate(_FILENAME_TABLE).strip('. ')
     # Limit length
     if len(cleaned) > 200:
         cleaned = cleaned[:200]
@@ -99,13 +175,12 @@ def get_file_size(filepath):
     """Get file size in human readable format"""
     try:
         size = os.path.getsize(filepath)
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
-    except:
+    except OSError:
         return "Unknown"
+    
+    # Each unit is 2**10 times the previous one, so bit_length picks it directly
+    index = min(max(size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
 
 
 def backup_file(filepath, backup_dir="backups"):
@@ -124,7 +199,7 @@ def backup_file(filepath, backup_dir="backups"):
         import shutil
         shutil.copy2(filepath, backup_path)
         return backup_path
-    except:
+    except OSError:
         return None
 
 
@@ -132,23 +207,98 @@ def merge_channel_lists(*channel_lists):
     """Merge multiple channel lists, removing duplicates"""
     merged = []
     seen_urls = set()
+    merged_append = merged.append
+    seen_add = seen_urls.add
     
-    for channel_list in channel_lists:
-        for channel in channel_list:
-            url = channel.get('url', '')
-            if url and url not in seen_urls:
-                merged.append(channel)
-                seen_urls.add(url)
+    for channel in chain.from_iterable(channel_lists):
+        url = channel.get('url')
+        if url and url not in seen_urls:
+            seen_add(url)
+            merged_append(channel)
     
     return merged
 
 
+class ChannelTable:
+    """Column-oriented view of a channel list for large playlists
+    
+    Each field is stored as one array (NumPy when available, plain lists
+    otherwise) so sorting, filtering and statistics run column-wise. The
+    source dicts ride along in a '_row' column, so to_dicts() keeps keys
+    outside COLUMNS and the difference between a missing and an empty field.
+    """
+    
+    COLUMNS = ('name', 'group', 'url', 'logo', 'epg', 'language', 'country')
+    
+    def __init__(self, columns):
+        self.columns = columns
+    
+    @classmethod
+    def from_dicts(cls, channels):
+        """Build a table from a list of channel dicts"""
+        columns = {}
+        for field in cls.COLUMNS:
+            values = [channel.get(field, '') or '' for channel in channels]
+            columns[field] = np.array(values, dtype=object) if np is not None else values
+        if np is not None:
+            rows = np.empty(len(channels), dtype=object)
+            rows[:] = channels
+        else:
+            rows = list(channels)
+        columns['_row'] = rows
+        return cls(columns)
+    
+    def __len__(self):
+        return len(self.columns['name'])
+    
+    def lowered(self, field):
+        """Lowercased copy of a column"""
+        values = self.columns[field]
+        if np is not None:
+            return np.char.lower(values.astype(str))
+        return [value.lower() for value in values]
+    
+    def reorder(self, indices):
+        """Return a new table with rows taken in the given order"""
+        if np is not None:
+            return ChannelTable({f: col[indices] for f, col in self.columns.items()})
+        return ChannelTable({f: [col[i] for i in indices] for f, col in self.columns.items()})
+    
+    def mask(self, selector):
+        """Return a new table with only the rows where selector is true"""
+        if np is not None:
+            return ChannelTable({f: col[selector] for f, col in self.columns.items()})
+        return ChannelTable({
+            f: [value for value, keep in zip(col, selector) if keep]
+            for f, col in self.columns.items()
+        })
+    
+    def to_dicts(self):
+        """Convert back to a list of channel dicts (copies of the source dicts)"""
+        return [dict(row) for row in self.columns['_row']]
+
+
+def _argsort(*keys):
+    """Stable argsort by one or more columns, primary key first"""
+    if np is not None:
+        return np.lexsort(keys[::-1])
+    rows = list(zip(*keys))
+    return sorted(range(len(rows)), key=rows.__getitem__)
+
+
 def filter_channels_by_group(channels, allowed_groups):
     """Filter channels by allowed groups"""
     if not allowed_groups:
         return channels
     
-    allowed_groups_lower = [g.lower() for g in allowed_groups]
+    if isinstance(channels, ChannelTable):
+        groups = channels.lowered('group')
+        allowed = {g.lower() for g in allowed_groups}
+        if np is not None:
+            return channels.mask(np.isin(groups, list(allowed)))
+        return channels.mask([group in allowed for group in groups])
+    
+    allowed_groups_lower = frozenset(g.lower() for g in allowed_groups)
     
     return [
         ch for ch in channels 
@@ -156,37 +306,77 @@ def filter_channels_by_group(channels, allowed_groups):
     ]
 
 
-def sort_channels(channels, sort_by='name'):
-    """Sort channels by specified criteria"""
-    if sort_by == 'name':
-        return sorted(channels, key=lambda x: x.get('name', '').lower())
-    elif sort_by == 'group':
-        return sorted(channels, key=lambda x: (x.get('group', ''), x.get('name', '')))
-    elif sort_by == 'url':
-        return sorted(channels, key=lambda x: x.get('url', ''))
-    else:
+def _name_sort_key(channel):
+    return channel.get('name', '').lower()
+
+
+def _group_sort_key(channel):
+    return (channel.get('group', ''), channel.get('name', '').lower())
+
+
+def _url_sort_key(channel):
+    return channel.get('url', '')
+
+
+_SORT_KEYS = {
+    'name': _name_sort_key,
+    'group': _group_sort_key,
+    'url': _url_sort_key
+}
+
+
+def sort_channels(channels, sort_by='name', key_func=None):
+    """Sort channels by specified criteria (or a custom key_func)"""
+    if isinstance(channels, ChannelTable):
+        if sort_by == 'name':
+            return channels.reorder(_argsort(channels.lowered('name')))
+        elif sort_by == 'group':
+            return channels.reorder(_argsort(channels.columns['group'], channels.lowered('name')))
+        elif sort_by == 'url':
+            return channels.reorder(_argsort(channels.columns['url']))
         return channels
+    
+    key_func = key_func or _SORT_KEYS.get(sort_by)
+    if key_func is None:
+        return channels
+    
+    # sorted() computes each key once up front and is stable
+    return sorted(channels, key=key_func)
 
 
 def get_channel_statistics(channels):
     """Get statistics about the channel list"""
-    stats = {
-        'total_channels': len(channels),
-        'groups': {},
-        'with_logo': 0,
-        'with_epg': 0,
-        'unique_urls': len(set(ch.get('url', '') for ch in channels if ch.get('url')))
-    }
+    if isinstance(channels, ChannelTable):
+        columns = channels.columns
+        return {
+            'total_channels': len(channels),
+            'groups': dict(Counter(row.get('group', 'Unknown') for row in columns['_row'])),
+            'with_logo': sum(1 for logo in columns['logo'] if logo),
+            'with_epg': sum(1 for epg in columns['epg'] if epg),
+            'unique_urls': len({url for url in columns['url'] if url})
+        }
+    
+    groups = Counter()
+    urls = set()
+    with_logo = with_epg = 0
     
+    # Single pass: count groups, logos, EPG and unique URLs together
     for channel in channels:
-        # Count by group
-        group = channel.get('group', 'Unknown')
-        stats['groups'][group] = stats['groups'].get(group, 0) + 1
+        groups[channel.get('group', 'Unknown')] += 1
         
-        # Count channels with logos and EPG
         if channel.get('logo'):
-            stats['with_logo'] += 1
+            with_logo += 1
         if channel.get('epg'):
-            stats['with_epg'] += 1
+            with_epg += 1
+        
+        url = channel.get('url')
+        if url:
+            urls.add(url)
     
-    return stats
\ No newline at end of file
+    return {
+        'total_channels': len(channels),
+        'groups': dict(groups),
+        'with_logo': with_logo,
+        'with_epg': with_epg,
+        'unique_urls': len(urls)
+    }
@@ -4,10 +4,13 @@ Logger Configuration Module
 Handles logging setup and configuration
 """
 
+import atexit
 import logging
 import os
+import queue
+import time
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 def setup_logger(name="m3u_editor", log_level=logging.INFO, log_dir="logs"):
@@ -67,10 +70,17 @@ def setup_logger(name="m3u_editor", log_level=logging.INFO, log_dir="logs"):
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(simple_formatter)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(error_handler)
-    logger.addHandler(console_handler)
+    # Write from a background listener so logging calls never block on disk I/O
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, file_handler, error_handler, console_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    logger.addHandler(QueueHandler(log_queue))
+    logger.listener = listener
     
     return logger
 
@@ -82,16 +92,21 @@ def setup_debug_logger(name="m3u_debug", log_dir="logs"):
 
 def log_function_call(func):
     """Decorator to log function calls"""
+    logger = logging.getLogger()
+    
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger()
-        logger.debug(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
+        # Skip building the (possibly huge) argument repr unless DEBUG is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Calling %s with args=%r, kwargs=%r", func.__name__, args, kwargs)
         
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"{func.__name__} completed successfully")
+            if debug:
+                logger.debug("%s completed successfully", func.__name__)
             return result
         except Exception as e:
-            logger.error(f"{func.__name__} failed with error: {e}")
+            logger.error("%s failed with error: %s", func.__name__, e)
             raise
     
     return wrapper
@@ -124,6 +139,11 @@ def create_session_logger(session_id, log_dir="logs"):
     return logger
 
 
+def _format_duration(elapsed_ns):
+    """Format a perf_counter_ns interval in milliseconds"""
+    return f"{elapsed_ns / 1e6:.3f} ms"
+
+
 class LogContext:
     """Context manager for logging operations"""
     
@@ -133,12 +153,12 @@ class LogContext:
         self.start_time = None
     
     def __enter__(self):
-        self.start_time = datetime.now()
+        self.start_time = time.perf_counter_ns()
         self.logger.info(f"Starting operation: {self.operation_name}")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = datetime.now() - self.start_time
+        duration = _format_duration(time.perf_counter_ns() - self.start_time)
         
         if exc_type is None:
             self.logger.info(f"Operation completed: {self.operation_name} (Duration: {duration})")
@@ -153,18 +173,18 @@ def log_performance(operation_name):
     def decorator(func):
         def wrapper(*args, **kwargs):
             logger = logging.getLogger()
-            start_time = datetime.now()
+            start_time = time.perf_counter_ns()
             
             logger.info(f"Starting {operation_name}")
             
             try:
                 result = func(*args, **kwargs)
-                duration = datetime.now() - start_time
+                duration = _format_duration(time.perf_counter_ns() - start_time)
                 logger.info(f"Completed {operation_name} in {duration}")
                 return result
                 
             except Exception as e:
-                duration = datetime.now() - start_time
+                duration = _format_duration(time.perf_counter_ns() - start_time)
                 logger.error(f"Failed {operation_name} after {duration}: {e}")
                 raise
         
@@ -6,11 +6,34 @@ Replace your scripts/modules/m3u_generator.py with this file
 
 import os
 import logging
-import re
+from collections import namedtuple
 from datetime import datetime
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# Characters that would break an EXTINF line, deleted via str.translate
+_CONTROL_CHARS_TABLE = str.maketrans('', '', '"\r\n\t')
+
+# Accepted stream URL schemes (longest is 8 characters)
+_VALID_SCHEMES = ('http://', 'https://', 'rtmp://', 'rtmps://', 'udp://', 'rtp://')
+
+# Cleaned channel record; tuple fields avoid per-access dict lookups
+Channel = namedtuple('Channel', 'name url group logo epg_id')
+
+def _first_value(channel: Dict, keys) -> Any:
+    """Return the first truthy value among alias keys, or None"""
+    for key in keys:
+        value = channel.get(key)
+        if value:
+            return value
+    return None
+
 class DefaultConfig:
     """Default configuration for M3U generation"""
     def __init__(self):
@@ -65,11 +88,8 @@ class M3UGenerator:
             if self.config.sort_channels:
                 valid_channels = self._sort_channels(valid_channels)
             
-            # Build M3U content
-            m3u_content = self._build_m3u_content(valid_channels, epg_url)
-            
-            # Write to file
-            success = self._write_playlist_file(m3u_content, output_path)
+            # Stream M3U content straight to the output file
+            success = self._write_playlist(valid_channels, output_path, epg_url)
             
             if success:
                 # Verify the file
@@ -86,7 +106,7 @@ class M3UGenerator:
                     'errors': self.stats['errors'],
                     'processing_time': processing_time,
                     'verification': verification_result,
-                    'file_size': os.path.getsize(output_path) if os.path.exists(output_path) else 0
+                    'file_size': verification_result.get('file_size', 0)
                 }
                 
                 self.logger.info(f"✅ M3U generation completed: {self.stats['channels_processed']} channels")
@@ -108,8 +128,22 @@ class M3UGenerator:
             'end_time': None
         }
     
-    def _validate_and_process_channels(self, channels: List[Dict]) -> List[Dict]:
+    # Playlists at least this large are cleaned column-wise with pandas
+    BATCH_THRESHOLD = 10000
+    
+    # Accepted field names for each channel attribute, in priority order
+    _NAME_KEYS = ('name', 'Channel Name', 'Name')
+    _URL_KEYS = ('url', 'Stream URL', 'URL')
+    _GROUP_KEYS = ('group', 'Group', 'group_title')
+    _LOGO_KEYS = ('logo', 'Logo', 'tvg-logo')
+    _EPG_KEYS = ('epg', 'EPG', 'tvg-id')
+    _FIELD_KEYS = _NAME_KEYS + _URL_KEYS + _GROUP_KEYS + _LOGO_KEYS + _EPG_KEYS
+    
+    def _validate_and_process_channels(self, channels: List[Dict]) -> List[Channel]:
         """Validate and clean channel data"""
+        if pd is not None and len(channels) >= self.BATCH_THRESHOLD:
+            return self._validate_and_process_batch(channels)
+        
         valid_channels = []
         
         for i, channel in enumerate(channels):
@@ -122,55 +156,92 @@ class M3UGenerator:
                     self.stats['channels_skipped'] += 1
                     
             except Exception as e:
-                self.logger.warning(f"Error processing channel {i}: {e}")
+                self.logger.warning("Error processing channel %d: %s", i, e)
                 self.stats['errors'] += 1
         
         return valid_channels
     
-    def _process_single_channel(self, channel: Dict, index: int) -> Optional[Dict]:
+    def _validate_and_process_batch(self, channels: List[Dict]) -> List[Channel]:
+        """Vectorized equivalent of _process_single_channel over all channels"""
+        # Object columns filled through dict.get, so ints are not upcast to
+        # float and a missing key (None) stays distinct from an explicit NaN.
+        # Only alias keys that occur in some channel get a column
+        present = set().union(*channels)
+        df = pd.DataFrame(
+            {key: [channel.get(key) for channel in channels] for key in self._FIELD_KEYS if key in present},
+            index=pd.RangeIndex(len(channels)),
+            dtype=object
+        )
+        
+        name = self._first_truthy(df, self._NAME_KEYS,
+                                  'Channel ' + pd.Series(df.index + 1, index=df.index).astype(str))
+        url = self._first_truthy(df, self._URL_KEYS, '')
+        group = self._first_truthy(df, self._GROUP_KEYS, 'General')
+        logo = self._first_truthy(df, self._LOGO_KEYS, '')
+        epg_id = self._first_truthy(df, self._EPG_KEYS, '')
+        
+        # Non-string URLs become NaN under .str and are rejected
+        url = url.str.strip()
+        valid = (url.str.len() > 0) & url.str[:8].str.lower().str.startswith(_VALID_SCHEMES)
+        valid = valid.fillna(False).astype(bool)
+        
+        # map(str) matches the per-channel str() calls (NaN becomes 'nan')
+        cleaned = zip(
+            name[valid].map(str).str.translate(_CONTROL_CHARS_TABLE).str.strip().tolist(),
+            url[valid].tolist(),
+            group[valid].map(str).str.translate(_CONTROL_CHARS_TABLE).str.strip().tolist(),
+            logo[valid].map(str).str.strip().tolist(),
+            epg_id[valid].map(str).str.strip().tolist()
+        )
+        valid_channels = list(map(Channel._make, cleaned))
+        
+        valid_count = len(valid_channels)
+        self.stats['channels_processed'] += valid_count
+        self.stats['channels_skipped'] += len(channels) - valid_count
+        
+        return valid_channels
+    
+    @staticmethod
+    def _first_truthy(df, keys, default):
+        """Column-wise `row[k1] or row[k2] or ... or default`"""
+        result = pd.Series(default, index=df.index, dtype=object)
+        for key in reversed(keys):
+            if key in df:
+                column = df[key]
+                truthy = column.map(bool).astype(bool)
+                result = column.where(truthy, result)
+        return result
+    
+    def _process_single_channel(self, channel: Dict, index: int) -> Optional[Channel]:
         """Process and validate a single channel"""
         try:
             # Extract basic info with multiple possible field names
-            name = (channel.get('name') or 
-                   channel.get('Channel Name') or 
-                   channel.get('Name') or 
-                   f'Channel {index + 1}')
-            
-            url = (channel.get('url') or 
-                  channel.get('Stream URL') or 
-                  channel.get('URL') or '')
-            
-            group = (channel.get('group') or 
-                    channel.get('Group') or 
-                    channel.get('group_title') or 
-                    'General')
+            name = _first_value(channel, self._NAME_KEYS) or f'Channel {index + 1}'
+            url = _first_value(channel, self._URL_KEYS) or ''
+            group = _first_value(channel, self._GROUP_KEYS) or 'General'
             
             # Validate required fields
             if not url or not url.strip():
-                self.logger.debug(f"Skipping channel {name}: No URL")
+                self.logger.debug("Skipping channel %s: No URL", name)
                 return None
             
             if not self._is_valid_url(url):
-                self.logger.debug(f"Skipping channel {name}: Invalid URL format")
+                self.logger.debug("Skipping channel %s: Invalid URL format", name)
                 return None
             
             # Clean and format data
-            cleaned_channel = {
-                'name': self._clean_channel_name(name),
-                'url': self._clean_url(url),
-                'group': self._clean_group_name(group),
-                'logo': self._clean_logo_url(channel.get('logo', '') or 
-                                           channel.get('Logo', '') or 
-                                           channel.get('tvg-logo', '')),
-                'epg_id': self._clean_epg_id(channel.get('epg', '') or 
-                                           channel.get('EPG', '') or 
-                                           channel.get('tvg-id', ''))
-            }
+            cleaned_channel = Channel(
+                name=self._clean_channel_name(name),
+                url=self._clean_url(url),
+                group=self._clean_group_name(group),
+                logo=self._clean_logo_url(_first_value(channel, self._LOGO_KEYS)),
+                epg_id=self._clean_epg_id(_first_value(channel, self._EPG_KEYS))
+            )
             
             return cleaned_channel
             
         except Exception as e:
-            self.logger.warning(f"Error processing channel at index {index}: {e}")
+            self.logger.warning("Error processing channel at index %d: %s", index, e)
             return None
     
     def _clean_channel_name(self, name: str) -> str:
@@ -178,7 +249,7 @@ class M3UGenerator:
         if not name:
             return "Unknown Channel"
         # Remove problematic characters
-        name = re.sub(r'["\r\n\t]', '', str(name))
+        name = str(name).translate(_CONTROL_CHARS_TABLE)
         return name.strip()
     
     def _clean_url(self, url: str) -> str:
@@ -190,7 +261,7 @@ class M3UGenerator:
         if not group:
             return "General"
         # Remove problematic characters
-        group = re.sub(r'["\r\n\t]', '', str(group))
+        group = str(group).translate(_CONTROL_CHARS_TABLE)
         return group.strip()
     
     def _clean_logo_url(self, logo: str) -> str:
@@ -206,70 +277,51 @@ class M3UGenerator:
         if not url:
             return False
         
-        url = url.strip().lower()
-        valid_schemes = ['http://', 'https://', 'rtmp://', 'rtmps://', 'udp://', 'rtp://']
-        
-        return any(url.startswith(scheme) for scheme in valid_schemes)
+        # Only the scheme prefix needs lowercasing, not the whole URL
+        return url.lstrip()[:8].lower().startswith(_VALID_SCHEMES)
     
-    def _sort_channels(self, channels: List[Dict]) -> List[Dict]:
+    def _sort_channels(self, channels: List[Channel]) -> List[Channel]:
         """Sort channels by group and name"""
         try:
-            return sorted(channels, key=lambda x: (x['group'].lower(), x['name'].lower()))
+            # Build the lowercase keys in one comprehension, then sort with a C-level key
+            keyed = [(c.group.lower(), c.name.lower(), c) for c in channels]
+            keyed.sort(key=itemgetter(0, 1))
+            return [entry[2] for entry in keyed]
         except Exception as e:
             self.logger.warning(f"Error sorting channels: {e}")
             return channels
     
-    def _build_m3u_content(self, channels: List[Dict], epg_url: Optional[str] = None) -> str:
-        """Build complete M3U content string"""
-        content_lines = []
-        
+    def _iter_m3u_lines(self, channels: List[Channel], epg_url: Optional[str] = None):
+        """Yield the M3U playlist line by line"""
         # Add M3U header
         if epg_url:
-            content_lines.append(f'#EXTM3U url-tvg="{epg_url}"')
+            yield f'#EXTM3U url-tvg="{epg_url}"'
         else:
-            content_lines.append('#EXTM3U')
-        
-        # Process each channel
-        for channel in channels:
-            try:
-                # Build EXTINF line
-                extinf_line = '#EXTINF:-1'
-                
-                # Add EPG ID if available
-                if channel['epg_id']:
-                    extinf_line += f' tvg-id="{channel["epg_id"]}"'
-                
-                # Add logo if available
-                if channel['logo']:
-                    extinf_line += f' tvg-logo="{channel["logo"]}"'
-                
-                # Add group
-                extinf_line += f' group-title="{channel["group"]}"'
-                
-                # Add channel name
-                extinf_line += f',{channel["name"]}'
-                
-                # Add EXTINF and URL
-                content_lines.append(extinf_line)
-                content_lines.append(channel['url'])
-                
-            except Exception as e:
-                self.logger.warning(f"Error building content for channel {channel.get('name', 'Unknown')}: {e}")
-                continue
+            yield '#EXTM3U'
         
-        return '\n'.join(content_lines)
+        # Process each channel (already validated and cleaned upstream)
+        for name, url, group, logo, epg_id in channels:
+            epg_attr = f' tvg-id="{epg_id}"' if epg_id else ''
+            logo_attr = f' tvg-logo="{logo}"' if logo else ''
+            yield f'#EXTINF:-1{epg_attr}{logo_attr} group-title="{group}",{name}'
+            yield url
     
-    def _write_playlist_file(self, content: str, output_path: str) -> bool:
-        """Write M3U content to file"""
+    def _write_playlist(self, channels: List[Channel], output_path: str,
+                        epg_url: Optional[str] = None) -> bool:
+        """Write the M3U playlist to file without building it in memory"""
         try:
             # Ensure output directory exists
             output_dir = os.path.dirname(output_path)
             if output_dir:
                 os.makedirs(output_dir, exist_ok=True)
             
-            # Write file with UTF-8 encoding
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Write file with UTF-8 encoding through a 1 MiB buffer
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                lines = self._iter_m3u_lines(channels, epg_url)
+                f.write(next(lines))
+                for line in lines:
+                    f.write('\n')
+                    f.write(line)
             
             self.logger.info(f"📁 M3U file written to: {output_path}")
             return True
@@ -280,35 +332,46 @@ class M3UGenerator:
     
     def _verify_m3u_file(self, file_path: str) -> Dict[str, Any]:
         """Verify the generated M3U file"""
+        file_size = 0
         try:
-            if not os.path.exists(file_path):
+            try:
+                file_size = os.path.getsize(file_path)
+            except OSError:
                 return {'valid': False, 'error': 'File does not exist'}
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            if not lines:
-                return {'valid': False, 'error': 'File is empty'}
+            extinf_count = url_count = total_lines = 0
+            first_urls = []
             
-            # Check for M3U header
-            first_line = lines[0].strip()
-            if not first_line.startswith('#EXTM3U'):
-                return {'valid': False, 'error': 'Missing #EXTM3U header'}
+            # Single pass: count lines and keep only the first 5 URLs
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    total_lines += 1
+                    line = line.strip()
+                    
+                    if total_lines == 1 and not line.startswith('#EXTM3U'):
+                        return {'valid': False, 'error': 'Missing #EXTM3U header', 'file_size': file_size}
+                    
+                    if line.startswith('#'):
+                        if line.startswith('#EXTINF'):
+                            extinf_count += 1
+                    elif line:
+                        url_count += 1
+                        if url_count <= 5:
+                            first_urls.append(line)
             
-            # Count EXTINF and URL lines
-            extinf_count = sum(1 for line in lines if line.strip().startswith('#EXTINF'))
-            url_lines = [line.strip() for line in lines if line.strip() and not line.strip().startswith('#')]
-            url_count = len(url_lines)
+            if not total_lines:
+                return {'valid': False, 'error': 'File is empty', 'file_size': file_size}
             
             if extinf_count != url_count:
                 return {
                     'valid': False, 
-                    'error': f'Structure mismatch: {extinf_count} EXTINF vs {url_count} URLs'
+                    'error': f'Structure mismatch: {extinf_count} EXTINF vs {url_count} URLs',
+                    'file_size': file_size
                 }
             
             # Verify URLs
             invalid_urls = []
-            for url in url_lines[:5]:  # Check first 5 URLs
+            for url in first_urls:  # Check first 5 URLs
                 if not self._is_valid_url(url):
                     invalid_urls.append(url[:50])
             
@@ -316,13 +379,13 @@ class M3UGenerator:
                 'valid': True,
                 'extinf_count': extinf_count,
                 'url_count': url_count,
-                'total_lines': len(lines),
-                'file_size': os.path.getsize(file_path),
+                'total_lines': total_lines,
+                'file_size': file_size,
                 'invalid_urls': invalid_urls[:3]  # Show max 3 invalid URLs
             }
             
         except Exception as e:
-            return {'valid': False, 'error': f'Verification error: {e}'}
+            return {'valid': False, 'error': f'Verification error: {e}', 'file_size': file_size}
     
     def _create_empty_playlist(self, output_path: str, reason: str = "No channels") -> Dict[str, Any]:
         """Create an empty but valid M3U playlist"""
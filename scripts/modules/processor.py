@@ -7,24 +7,86 @@ Main processing logic for M3U playlist operations
 import requests
 import re
 import os
+import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from urllib.parse import urlparse
-from .helper import normalize_channel_name, extract_channel_info, validate_url
+from .helper import normalize_channel_name, extract_channel_info, validate_url, HTTP_POOL_SIZE
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Keyword rules checked in order; the first group whose keywords appear wins
+GROUP_KEYWORDS = (
+    ('News', ('news', 'cnn', 'bbc news', 'fox news')),
+    ('Sports', ('sport', 'espn', 'fox sports', 'sky sport')),
+    ('Movies', ('movie', 'cinema', 'film', 'hbo', 'starz')),
+    ('Kids', ('kids', 'cartoon', 'disney', 'nick')),
+    ('Music', ('music', 'mtv', 'vh1')),
+    # Country-based detection
+    ('US Channels', ('usa', 'america', 'us ')),
+    ('UK Channels', ('uk', 'britain', 'british')),
+    ('Canadian Channels', ('canada', 'canadian'))
+)
+
+LANGUAGE_KEYWORDS = (
+    ('Spanish', ('español', 'spanish', 'mexico', 'spain')),
+    ('French', ('français', 'french', 'france')),
+    ('German', ('deutsch', 'german', 'germany')),
+    ('Italian', ('italiano', 'italian', 'italy')),
+    ('Portuguese', ('português', 'portuguese', 'brazil', 'portugal'))
+)
+
+
+def _build_keyword_automaton():
+    """One automaton over every group and language keyword.
+    
+    Values are (field, rank, value); the lowest rank per field wins, which
+    reproduces the ordered rule checks above in a single scan.
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for field, rules in (('group', GROUP_KEYWORDS), ('language', LANGUAGE_KEYWORDS)):
+        for rank, (value, keywords) in enumerate(rules):
+            for keyword in keywords:
+                if not automaton.exists(keyword):
+                    automaton.add_word(keyword, [])
+                automaton.get(keyword).append((field, rank, value))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
 
 
 class M3UProcessor:
     """Main M3U processor class"""
     
+    # Channels buffered per writelines call in export_to_m3u
+    EXPORT_CHUNK_SIZE = 4096
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.channels = []
         self.stats = {}
+        
+        # Pooled HTTP session shared by concurrent playlist downloads
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
     
     def download_playlist(self, url, timeout=30):
         """Download M3U playlist from URL"""
         try:
             self.logger.info(f"Downloading playlist from: {url}")
-            response = requests.get(url, timeout=timeout)
+            response = self._session.get(url, timeout=timeout)
             response.raise_for_status()
             return response.text
         except Exception as e:
@@ -33,8 +95,21 @@ class M3UProcessor:
     
     def parse_m3u_content(self, content):
         """Parse M3U content and extract channel information"""
+        # Same parser as streamed downloads; StringIO yields the lines
+        # without building a list of them
+        channels = self._parse_lines(io.StringIO(content))
+        self.logger.info(f"Parsed {len(channels)} channels from M3U content")
+        return channels
+    
+    def parse_m3u_lines(self, lines):
+        """Parse M3U lines from any iterable (file, response stream, list)"""
+        channels = self._parse_lines(lines)
+        self.logger.info(f"Parsed {len(channels)} channels from M3U stream")
+        return channels
+    
+    def _parse_lines(self, lines):
+        """Pair each EXTINF line with the next non-comment line as its URL"""
         channels = []
-        lines = content.split('\n')
         current_channel = None
         
         for line in lines:
@@ -50,61 +125,69 @@ class M3UProcessor:
                 channels.append(current_channel)
                 current_channel = None
         
-        self.logger.info(f"Parsed {len(channels)} channels from M3U content")
         return channels
     
-    def process_playlist_url(self, url):
-        """Process a single playlist URL"""
-        content = self.download_playlist(url)
-        if content:
-            return self.parse_m3u_content(content)
-        return []
+    def process_playlist_url(self, url, timeout=30):
+        """Process a single playlist URL, parsing while it downloads"""
+        try:
+            self.logger.info(f"Downloading playlist from: {url}")
+            with self._session.get(url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                if response.encoding is None:
+                    # No charset from the headers: response.text detects one
+                    # from the whole body, as download_playlist gets it
+                    return self.parse_m3u_content(response.text)
+                return self.parse_m3u_lines(response.iter_lines(decode_unicode=True))
+        except Exception as e:
+            self.logger.error(f"Error downloading playlist from {url}: {e}")
+            return []
     
-    def process_multiple_playlists(self, urls):
+    def process_multiple_playlists(self, urls, max_workers=16):
         """Process multiple playlist URLs"""
-        all_channels = []
-        
-        for url in urls:
-            channels = self.process_playlist_url(url)
-            all_channels.extend(channels)
-        
-        # Remove duplicates based on URL
-        unique_channels = []
-        seen_urls = set()
+        # Downloads are I/O bound, so fetch the playlists in parallel
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            all_channels = list(chain.from_iterable(pool.map(self.process_playlist_url, urls)))
         
+        # Remove duplicates based on URL (dict keeps the first channel per URL, in order)
+        unique_by_url = {}
         for channel in all_channels:
-            url = channel.get('url', '')
-            if url and url not in seen_urls:
-                unique_channels.append(channel)
-                seen_urls.add(url)
+            url = channel.get('url')
+            if url:
+                unique_by_url.setdefault(url, channel)
+        unique_channels = list(unique_by_url.values())
         
         self.channels = unique_channels
         self.logger.info(f"Processed {len(all_channels)} total channels, {len(unique_channels)} unique")
         return unique_channels
     
-    def filter_working_streams(self, channels=None, timeout=10, max_checks=None):
+    def filter_working_streams(self, channels=None, timeout=10, max_checks=None, max_workers=32):
         """Filter channels to only include working streams"""
         if channels is None:
             channels = self.channels
         
-        working_channels = []
-        checked = 0
+        if max_checks is not None and len(channels) > max_checks:
+            self.logger.warning(f"Reached maximum check limit of {max_checks}")
+            channels = channels[:max_checks]
         
-        for channel in channels:
-            if checked >= max_checks:
-                self.logger.warning(f"Reached maximum check limit of {max_checks}")
-                break
-            
+        def is_working(channel):
             url = channel.get('url', '')
-            if url and validate_url(url, timeout):
-                working_channels.append(channel)
-                self.logger.debug(f"Working stream: {channel.get('name', 'Unknown')}")
-            else:
-                self.logger.debug(f"Non-working stream: {channel.get('name', 'Unknown')}")
-            
-            checked += 1
+            return bool(url) and validate_url(url, timeout)
+        
+        # URL checks are network-bound, so run them concurrently (order is kept).
+        # Workers are capped at the shared session's connection pool size
+        max_workers = min(max_workers, HTTP_POOL_SIZE)
+        working_channels = []
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for channel, working in zip(channels, pool.map(is_working, channels)):
+                if working:
+                    working_channels.append(channel)
+                    if debug:
+                        self.logger.debug("Working stream: %s", channel.get('name', 'Unknown'))
+                elif debug:
+                    self.logger.debug("Non-working stream: %s", channel.get('name', 'Unknown'))
         
-        self.logger.info(f"Found {len(working_channels)} working streams out of {checked} checked")
+        self.logger.info(f"Found {len(working_channels)} working streams out of {len(channels)} checked")
         return working_channels
     
     def group_channels_by_category(self, channels=None):
@@ -127,75 +210,69 @@ class M3UProcessor:
         if channels is None:
             channels = self.channels
         
-        unique_channels = []
-        seen_combinations = set()
-        
+        unique_by_key = {}
         for channel in channels:
-            name = normalize_channel_name(channel.get('name', ''))
-            url = channel.get('url', '')
-            
-            combination = (name, url)
-            if combination not in seen_combinations:
-                unique_channels.append(channel)
-                seen_combinations.add(combination)
+            combination = (normalize_channel_name(channel.get('name', '')), channel.get('url', ''))
+            unique_by_key.setdefault(combination, channel)
+        unique_channels = list(unique_by_key.values())
         
         self.logger.info(f"Removed {len(channels) - len(unique_channels)} duplicate channels")
         return unique_channels
     
-    def enhance_channel_info(self, channels=None):
-        """Enhance channel information with smart detection"""
+    def enhance_channel_info(self, channels=None, in_place=False):
+        """Enhance channel information with smart detection
+        
+        With in_place=True the input dicts are updated directly instead of
+        being copied, which avoids one dict allocation per channel.
+        """
         if channels is None:
             channels = self.channels
         
         enhanced = []
         
         for channel in channels:
-            enhanced_channel = channel.copy()
-            name = channel.get('name', '').lower()
-            
-            # Auto-detect country/group if not set
-            if not enhanced_channel.get('group') or enhanced_channel['group'] == 'General':
-                enhanced_channel['group'] = self._detect_channel_group(name)
+            enhanced_channel = channel if in_place else {**channel}
+            needs_group = not enhanced_channel.get('group') or enhanced_channel['group'] == 'General'
+            needs_language = not enhanced_channel.get('language')
             
-            # Auto-detect language
-            if not enhanced_channel.get('language'):
-                enhanced_channel['language'] = self._detect_language(name)
+            if needs_group or needs_language:
+                group, language = self._detect_group_and_language(channel.get('name', '').lower())
+                
+                # Auto-detect country/group if not set
+                if needs_group:
+                    enhanced_channel['group'] = group
+                
+                # Auto-detect language
+                if needs_language:
+                    enhanced_channel['language'] = language
             
             enhanced.append(enhanced_channel)
         
         return enhanced
     
+    def _detect_group_and_language(self, name_lower):
+        """Detect group and language together from a lowercased name"""
+        if _KEYWORD_AUTOMATON is None:
+            return self._detect_channel_group(name_lower), self._detect_language(name_lower)
+        
+        best = {}
+        for _, hits in _KEYWORD_AUTOMATON.iter(name_lower):
+            for field, rank, value in hits:
+                current = best.get(field)
+                if current is None or rank < current[0]:
+                    best[field] = (rank, value)
+        
+        group = best['group'][1] if 'group' in best else 'General'
+        language = best['language'][1] if 'language' in best else 'English'
+        return group, language
+    
     def _detect_channel_group(self, name):
         """Detect channel group from name"""
         name_lower = name.lower()
         
-        # News channels
-        if any(keyword in name_lower for keyword in ['news', 'cnn', 'bbc news', 'fox news']):
-            return 'News'
-        
-        # Sports channels
-        if any(keyword in name_lower for keyword in ['sport', 'espn', 'fox sports', 'sky sport']):
-            return 'Sports'
-        
-        # Movies channels
-        if any(keyword in name_lower for keyword in ['movie', 'cinema', 'film', 'hbo', 'starz']):
-            return 'Movies'
-        
-        # Kids channels
-        if any(keyword in name_lower for keyword in ['kids', 'cartoon', 'disney', 'nick']):
-            return 'Kids'
-        
-        # Music channels
-        if any(keyword in name_lower for keyword in ['music', 'mtv', 'vh1']):
-            return 'Music'
-        
-        # Country-based detection
-        if any(keyword in name_lower for keyword in ['usa', 'america', 'us ']):
-            return 'US Channels'
-        elif any(keyword in name_lower for keyword in ['uk', 'britain', 'british']):
-            return 'UK Channels'
-        elif any(keyword in name_lower for keyword in ['canada', 'canadian']):
-            return 'Canadian Channels'
+        for group, keywords in GROUP_KEYWORDS:
+            if any(keyword in name_lower for keyword in keywords):
+                return group
         
         return 'General'
     
@@ -203,16 +280,9 @@ class M3UProcessor:
         """Detect language from channel name"""
         name_lower = name.lower()
         
-        if any(keyword in name_lower for keyword in ['español', 'spanish', 'mexico', 'spain']):
-            return 'Spanish'
-        elif any(keyword in name_lower for keyword in ['français', 'french', 'france']):
-            return 'French'
-        elif any(keyword in name_lower for keyword in ['deutsch', 'german', 'germany']):
-            return 'German'
-        elif any(keyword in name_lower for keyword in ['italiano', 'italian', 'italy']):
-            return 'Italian'
-        elif any(keyword in name_lower for keyword in ['português', 'portuguese', 'brazil', 'portugal']):
-            return 'Portuguese'
+        for language, keywords in LANGUAGE_KEYWORDS:
+            if any(keyword in name_lower for keyword in keywords):
+                return language
         
         return 'English'  # Default
     
@@ -223,6 +293,8 @@ class M3UProcessor:
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write('#EXTM3U\n')
             
+            # Buffer formatted entries and hand them to writelines in chunks
+            buf = []
             for channel in channels:
                 if channel.get('url') and channel.get('name'):
                     # Build EXTINF line
@@ -239,17 +311,34 @@ class M3UProcessor:
                     
                     extinf += f' group-title="{channel.get("group", "General")}",{channel["name"]}'
                     
-                    f.write(f'{extinf}\n')
-                    f.write(f'{channel["url"]}\n')
+                    buf.append(f'{extinf}\n{channel["url"]}\n')
+                    if len(buf) >= self.EXPORT_CHUNK_SIZE:
+                        f.writelines(buf)
+                        buf.clear()
+            
+            f.writelines(buf)
         
         self.logger.info(f"Exported {len(channels)} channels to {filepath}")
     
     def get_processing_stats(self):
         """Get processing statistics"""
+        groups = set()
+        languages = set()
+        with_logos = with_epg = 0
+        
+        # One pass over the channels instead of four
+        for channel in self.channels:
+            groups.add(channel.get('group', 'General'))
+            languages.add(channel.get('language', 'Unknown'))
+            if channel.get('logo'):
+                with_logos += 1
+            if channel.get('epg'):
+                with_epg += 1
+        
         return {
             'total_channels': len(self.channels),
-            'groups': len(set(ch.get('group', 'General') for ch in self.channels)),
-            'with_logos': len([ch for ch in self.channels if ch.get('logo')]),
-            'with_epg': len([ch for ch in self.channels if ch.get('epg')]),
-            'languages': len(set(ch.get('language', 'Unknown') for ch in self.channels))
+            'groups': len(groups),
+            'with_logos': with_logos,
+            'with_epg': with_epg,
+            'languages': len(languages)
         }
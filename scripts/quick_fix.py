@@ -6,30 +6,75 @@ Run this to fix immediate issues and get your tool working
 
 import os
 import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+# Per-thread log buffer; fix steps running in the pool collect their lines
+# here so main() can print each step's output in order
+_log_buffer = threading.local()
+
 def log(message):
     """Simple logging function"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[{timestamp}] {message}")
+    # time.strftime formats the local time without building a datetime object
+    line = f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {message}"
+    lines = getattr(_log_buffer, "lines", None)
+    if lines is None:
+        print(line)
+    else:
+        lines.append(line)
 
-def create_missing_modules():
-    """Create any missing module files with working implementations"""
-    
-    modules_dir = Path("scripts/modules")
-    modules_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create __init__.py if missing
-    init_file = modules_dir / "__init__.py"
-    if not init_file.exists():
-        init_file.write_text("")
-        log("✅ Created scripts/modules/__init__.py")
-    
-    # Create processor.py fallback
-    processor_file = modules_dir / "processor.py"
-    if not processor_file.exists() or processor_file.stat().st_size < 100:
-        processor_content = '''"""
+def run_buffered(step):
+    """Run a fix step, returning (logged lines, exception or None)"""
+    _log_buffer.lines = []
+    try:
+        step()
+        return _log_buffer.lines, None
+    except Exception as e:
+        return _log_buffer.lines, e
+    finally:
+        _log_buffer.lines = None
+
+def existing_file_sizes(directory, names):
+    """Map each of names present in directory to its size with one directory scan"""
+    sizes = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name in names and entry.is_file():
+                    sizes[entry.name] = entry.stat().st_size
+    except FileNotFoundError:
+        pass
+    return sizes
+
+def count_extinf(path, chunk_size=1 << 20):
+    """Count lines starting with #EXTINF (like grep -c '^#EXTINF') with bytes.count"""
+    count = 0
+    # Seed with a newline so the first line counts; carrying the last 7 bytes
+    # catches matches split across chunks without counting any twice
+    tail = b'\n'
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            block = tail + chunk
+            count += block.count(b'\n#EXTINF')
+            tail = block[-7:]
+    return count
+
+def write_if_changed(path, data):
+    """Write data to path unless the file already holds exactly those bytes"""
+    try:
+        # A size mismatch settles it without reading the file
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+# Written by create_missing_modules(); encoded once at import
+_PROCESSOR_PY = '''"""
 Basic M3U Processor Module
 """
 
@@ -42,71 +87,72 @@ class M3UProcessor:
     
     def process_channels(self, channels):
         """Process channels with basic validation"""
-        valid_channels = []
-        for channel in channels:
-            if channel.get('url') and channel.get('name'):
-                valid_channels.append(channel)
-        return valid_channels
+        return [channel for channel in channels if channel.get('url') and channel.get('name')]
     
     def remove_duplicates(self, channels):
         """Remove duplicate channels based on URL"""
-        seen_urls = set()
-        unique_channels = []
-        
+        # dict keeps the first channel per URL, in insertion order
+        unique_by_url = {}
         for channel in channels:
-            url = channel.get('url', '').strip()
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_channels.append(channel)
+            if url := channel.get('url', '').strip():
+                unique_by_url.setdefault(url, channel)
         
-        return unique_channels
+        return list(unique_by_url.values())
     
     def is_valid_url(self, url):
         """Check if URL is valid"""
         if not url or len(url) < 10:
             return False
         return url.startswith(('http://', 'https://', 'rtmp://', 'rtmps://'))
-'''
-        processor_file.write_text(processor_content)
-        log("✅ Created/Updated scripts/modules/processor.py")
-    
-    # Create config_manager.py fallback
-    config_file = modules_dir / "config_manager.py"
-    if not config_file.exists() or config_file.stat().st_size < 100:
-        config_content = '''"""
+'''.encode('utf-8')
+
+_CONFIG_MANAGER_PY = '''"""
 Configuration Manager Module
 """
 
 import os
 
+PROVIDERS_FILE = 'config/providers.txt'
+
 class ConfigManager:
     def __init__(self):
         self.config = {}
+        self._providers_mtime = None
     
     def load_config(self):
-        """Load configuration from files"""
-        config = {}
+        """Load configuration from files, reusing the last result while providers.txt is unchanged"""
+        try:
+            mtime = os.stat(PROVIDERS_FILE).st_mtime_ns
+        except OSError:
+            self.config = {}
+            self._providers_mtime = None
+            return {}
+        
+        if mtime == self._providers_mtime:
+            return self.config
         
-        # Load providers
-        if os.path.exists('config/providers.txt'):
-            with open('config/providers.txt', 'r') as f:
-                providers = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-                config['providers'] = providers
+        # Load providers in file order, dropping repeated URLs as they stream in
+        providers = []
+        seen = set()
+        with open(PROVIDERS_FILE, 'r') as f:
+            for line in f:
+                stripped = line.strip()
+                if stripped and not line.startswith('#') and stripped not in seen:
+                    seen.add(stripped)
+                    providers.append(stripped)
         
-        return config
+        # Ordered, immutable tuple for iteration plus a frozenset for O(1) membership
+        self.config = {'providers': tuple(providers), 'providers_set': frozenset(seen)}
+        self._providers_mtime = mtime
+        return self.config
     
     def get_providers(self):
         """Get list of provider URLs"""
         config = self.load_config()
-        return config.get('providers', [])
-'''
-        config_file.write_text(config_content)
-        log("✅ Created/Updated scripts/modules/config_manager.py")
-    
-    # Create logger_config.py fallback
-    logger_file = modules_dir / "logger_config.py"
-    if not logger_file.exists() or logger_file.stat().st_size < 100:
-        logger_content = '''"""
+        return list(config.get('providers', []))
+'''.encode('utf-8')
+
+_LOGGER_CONFIG_PY = '''"""
 Logger Configuration Module
 """
 
@@ -130,15 +176,41 @@ def setup_logger():
     )
     
     return logging.getLogger(__name__)
-'''
-        logger_file.write_text(logger_content)
-        log("✅ Created/Updated scripts/modules/logger_config.py")
+'''.encode('utf-8')
 
-def fix_country_grouper():
-    """Fix country_grouper.py to handle missing pycountry"""
-    country_file = Path("scripts/country_grouper.py")
+def create_missing_modules():
+    """Create any missing module files with working implementations"""
     
-    country_content = '''"""
+    modules_dir = Path("scripts/modules")
+    modules_dir.mkdir(parents=True, exist_ok=True)
+    existing = existing_file_sizes(modules_dir, {"__init__.py", "processor.py", "config_manager.py", "logger_config.py"})
+    
+    # Create __init__.py if missing
+    init_file = modules_dir / "__init__.py"
+    if "__init__.py" not in existing:
+        init_file.write_text("")
+        log("✅ Created scripts/modules/__init__.py")
+    
+    # Create processor.py fallback
+    processor_file = modules_dir / "processor.py"
+    if existing.get("processor.py", 0) < 100:
+        processor_file.write_bytes(_PROCESSOR_PY)
+        log("✅ Created/Updated scripts/modules/processor.py")
+    
+    # Create config_manager.py fallback
+    config_file = modules_dir / "config_manager.py"
+    if existing.get("config_manager.py", 0) < 100:
+        config_file.write_bytes(_CONFIG_MANAGER_PY)
+        log("✅ Created/Updated scripts/modules/config_manager.py")
+    
+    # Create logger_config.py fallback
+    logger_file = modules_dir / "logger_config.py"
+    if existing.get("logger_config.py", 0) < 100:
+        logger_file.write_bytes(_LOGGER_CONFIG_PY)
+        log("✅ Created/Updated scripts/modules/logger_config.py")
+
+# Written by fix_country_grouper(); encoded once at import
+_COUNTRY_GROUPER_PY = '''"""
 Country detection and grouping functionality
 Fixed version that handles missing pycountry gracefully
 """
@@ -152,36 +224,44 @@ except ImportError:
 import re
 from typing import Optional, Dict, List
 
+# One alternation per country code, so each country costs a single search
+COUNTRY_PATTERNS = {
+    'US': r'\\b(usa?|united states|american?|us)\\b',
+    'UK': r'\\b(uk|united kingdom|british?|gb)\\b',
+    'CA': r'\\b(canada|canadian?|ca)\\b',
+    'DE': r'\\b(germany|german|deutschland|de)\\b',
+    'FR': r'\\b(france|french|français|fr)\\b',
+    'ES': r'\\b(spain|spanish|españa|es)\\b',
+    'IT': r'\\b(italy|italian|italia|it)\\b',
+    'BR': r'\\b(brazil|brazilian|brasil|br)\\b',
+    'MX': r'\\b(mexico|mexican|méxico|mx)\\b',
+    'IN': r'\\b(india|indian|in)\\b',
+    'AU': r'\\b(australia|australian|aussie|au)\\b',
+    'NL': r'\\b(netherlands|dutch|holland|nl)\\b',
+    'TR': r'\\b(turkey|turkish|türkiye|tr)\\b',
+    'AR': r'\\b(argentina|argentinian|ar)\\b',
+    'RU': r'\\b(russia|russian|ru)\\b'
+}
+
+# All countries fused into one regex, compiled once at import. Each country
+# sits in its own lookahead and the alternatives are tried in
+# COUNTRY_PATTERNS order, so a single match() keeps first-country-wins
+# priority and lastgroup names the winning code.
+_COUNTRY_REGEX = re.compile(
+    '|'.join(f'(?=.*?(?P<{code}>{pattern}))' for code, pattern in COUNTRY_PATTERNS.items()),
+    re.IGNORECASE | re.DOTALL
+)
+
 class CountryGrouper:
     def __init__(self):
-        self.country_patterns = {
-            'US': [r'\\b(usa?|united states|american?)\\b', r'\\bus\\b'],
-            'UK': [r'\\b(uk|united kingdom|british?)\\b', r'\\bgb\\b'],
-            'CA': [r'\\b(canada|canadian?)\\b', r'\\bca\\b'],
-            'DE': [r'\\b(germany|german|deutschland)\\b', r'\\bde\\b'],
-            'FR': [r'\\b(france|french|français)\\b', r'\\bfr\\b'],
-            'ES': [r'\\b(spain|spanish|españa)\\b', r'\\bes\\b'],
-            'IT': [r'\\b(italy|italian|italia)\\b', r'\\bit\\b'],
-            'BR': [r'\\b(brazil|brazilian|brasil)\\b', r'\\bbr\\b'],
-            'MX': [r'\\b(mexico|mexican|méxico)\\b', r'\\bmx\\b'],
-            'IN': [r'\\b(india|indian)\\b', r'\\bin\\b'],
-            'AU': [r'\\b(australia|australian|aussie)\\b', r'\\bau\\b'],
-            'NL': [r'\\b(netherlands|dutch|holland)\\b', r'\\bnl\\b'],
-            'TR': [r'\\b(turkey|turkish|türkiye)\\b', r'\\btr\\b'],
-            'AR': [r'\\b(argentina|argentinian)\\b', r'\\bar\\b'],
-            'RU': [r'\\b(russia|russian)\\b', r'\\bru\\b']
-        }
+        self.country_regex = _COUNTRY_REGEX
 
     def detect_country(self, name: str, group: str = "") -> Optional[str]:
         """Detect country from channel name and group"""
         text = f"{name} {group}".lower()
         
-        for country_code, patterns in self.country_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return country_code
-        
-        return None
+        match = self.country_regex.match(text)
+        return match.lastgroup if match else None
 
     def group_by_country(self, channels: List[Dict]) -> Dict[str, List[Dict]]:
         """Group channels by detected country"""
@@ -207,24 +287,64 @@ def detect_country_from_text(text: str) -> Optional[str]:
     """Standalone function for country detection"""
     grouper = CountryGrouper()
     return grouper.detect_country(text)
-'''
-    
-    country_file.write_text(country_content)
-    log("✅ Fixed scripts/country_grouper.py")
+'''.encode('utf-8')
 
-def create_fallback_imports():
-    """Create fallback import files"""
-    scripts_dir = Path("scripts")
+def fix_country_grouper():
+    """Fix country_grouper.py to handle missing pycountry"""
+    country_file = Path("scripts/country_grouper.py")
     
-    # Create importer.py fallback
-    importer_file = scripts_dir / "importer.py"
-    if not importer_file.exists() or importer_file.stat().st_size < 100:
-        importer_content = '''"""
+    if write_if_changed(country_file, _COUNTRY_GROUPER_PY):
+        log("✅ Fixed scripts/country_grouper.py")
+    else:
+        log("✅ scripts/country_grouper.py already up to date")
+
+# Written by create_fallback_imports(); encoded once at import
+_IMPORTER_PY = '''"""
 M3U Importer Module - Fallback Implementation
 """
 
+import asyncio
+import codecs
+import io
+from itertools import chain
+
 import requests
-import re
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from charset_normalizer import from_bytes
+except ImportError:
+    from_bytes = None
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Shared keep-alive session so repeated imports reuse connections
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': USER_AGENT})
+
+# How much of a file to sample when guessing its encoding
+SNIFF_BYTES = 64 * 1024
+
+def detect_encoding(filepath):
+    """Guess a file's encoding from its first bytes, defaulting to UTF-8"""
+    with open(filepath, 'rb') as f:
+        sample = f.read(SNIFF_BYTES)
+    
+    # Fast path: valid UTF-8 (ignoring a sequence cut off by the sample size)
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    
+    if from_bytes is None:
+        return 'utf-8'
+    best = from_bytes(sample).best()
+    return best.encoding if best else 'utf-8'
 
 class M3UImporter:
     def __init__(self):
@@ -233,9 +353,10 @@ class M3UImporter:
     def import_from_file(self, filepath):
         """Import channels from local M3U file"""
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            return self.parse_m3u_content(content)
+            # Parse line by line instead of reading the whole file first
+            encoding = detect_encoding(filepath)
+            with open(filepath, 'r', encoding=encoding, errors='replace') as f:
+                return self.parse_m3u_lines(f)
         except Exception as e:
             print(f"Error importing {filepath}: {e}")
             return []
@@ -243,46 +364,90 @@ class M3UImporter:
     def import_from_url(self, url):
         """Import channels from M3U URL"""
         try:
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            return self.parse_m3u_content(response.text)
+            # Stream the response so parsing starts before the download finishes
+            with _SESSION.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                if response.encoding is None:
+                    response.encoding = 'utf-8'
+                return self.parse_m3u_lines(response.iter_lines(decode_unicode=True))
         except Exception as e:
             print(f"Error importing {url}: {e}")
             return []
     
+    async def import_many(self, urls, concurrency=8):
+        """Import channels from several M3U URLs concurrently"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        if aiohttp is None:
+            # No aiohttp: run the synchronous imports in worker threads instead
+            loop = asyncio.get_running_loop()
+            
+            async def fetch(url):
+                async with semaphore:
+                    return await loop.run_in_executor(None, self.import_from_url, url)
+            
+            results = await asyncio.gather(*(fetch(url) for url in urls))
+            return list(chain.from_iterable(results))
+        
+        timeout = aiohttp.ClientTimeout(total=30)
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector,
+                                         headers={'User-Agent': USER_AGENT}) as session:
+            async def fetch(url):
+                async with semaphore:
+                    try:
+                        async with session.get(url) as response:
+                            response.raise_for_status()
+                            content = await response.text(encoding='utf-8', errors='ignore')
+                    except Exception as e:
+                        print(f"Error importing {url}: {e}")
+                        return []
+                return self.parse_m3u_content(content)
+            
+            results = await asyncio.gather(*(fetch(url) for url in urls))
+        
+        return list(chain.from_iterable(results))
+    
     def parse_m3u_content(self, content):
         """Basic M3U parsing"""
+        return self.parse_m3u_lines(io.StringIO(content))
+    
+    def parse_m3u_lines(self, lines):
+        """Parse M3U lines from any iterable (file, response stream, list)"""
         channels = []
-        lines = content.split('\\n')
         current_channel = None
         
         for line in lines:
             line = line.strip()
-            if line.startswith('#EXTINF:'):
-                # Extract name from EXTINF line
-                name_match = re.search(r',(.+)$', line)
-                name = name_match.group(1) if name_match else 'Unknown'
-                current_channel = {'name': name, 'group': 'General'}
-            elif line and not line.startswith('#') and current_channel:
+            if not line:
+                continue
+            # Classify on the first character so URL lines skip startswith
+            if line[0] == '#':
+                if line.startswith('#EXTINF:'):
+                    # Name is everything after the first comma
+                    name = line.partition(',')[2] or 'Unknown'
+                    current_channel = {'name': name, 'group': 'General'}
+            elif current_channel is not None:
                 current_channel['url'] = line
                 channels.append(current_channel)
                 current_channel = None
         
         return channels
-'''
-        importer_file.write_text(importer_content)
-        log("✅ Created scripts/importer.py")
-    
-    # Create exporter.py fallback
-    exporter_file = scripts_dir / "exporter.py"
-    if not exporter_file.exists() or exporter_file.stat().st_size < 100:
-        exporter_content = '''"""
+'''.encode('utf-8')
+
+_EXPORTER_PY = '''"""
 M3U Exporter Module - Fallback Implementation
 """
 
+import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class M3UExporter:
     def __init__(self):
         pass
@@ -291,55 +456,51 @@ class M3UExporter:
         """Export channels to M3U file"""
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('#EXTM3U\\n')
-            for channel in channels:
-                name = channel.get('name', 'Unknown')
-                url = channel.get('url', '')
-                group = channel.get('group', '')
-                
-                # Write EXTINF line
-                extinf = f'#EXTINF:-1'
-                if group:
-                    extinf += f' group-title="{group}"'
-                extinf += f',{name}\\n'
-                f.write(extinf)
-                
-                # Write URL
-                f.write(f'{url}\\n')
+        # One writelines call over a generator; the 1 MiB buffer batches the syscalls
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(self._iter_m3u_lines(channels))
+    
+    def _iter_m3u_lines(self, channels):
+        """Yield the M3U header, then one EXTINF + URL chunk per channel"""
+        yield '#EXTM3U\\n'
+        for channel in channels:
+            group = channel.get('group', '')
+            group_part = f' group-title="{group}"' if group else ''
+            yield f'#EXTINF:-1{group_part},{channel.get("name", "Unknown")}\\n{channel.get("url", "")}\\n'
     
     def export_json(self, channels, filepath):
         """Export channels to JSON file"""
-        import json
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(channels, f, indent=2, ensure_ascii=False)
-'''
-        exporter_file.write_text(exporter_content)
-        log("✅ Created scripts/exporter.py")
+        # Serialize in one go and write the encoded document with a single call
+        if orjson is not None:
+            data = orjson.dumps(channels, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(channels, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        with open(filepath, 'wb') as f:
+            f.write(data)
+'''.encode('utf-8')
 
-def fix_process_yml():
-    """Fix the truncated process.yml file"""
-    workflow_dir = Path(".github/workflows")
-    workflow_dir.mkdir(parents=True, exist_ok=True)
+def create_fallback_imports():
+    """Create fallback import files"""
+    scripts_dir = Path("scripts")
+    existing = existing_file_sizes(scripts_dir, {"importer.py", "exporter.py"})
     
-    # Check if process.yml is truncated
-    process_yml = workflow_dir / "process.yml"
+    # Create importer.py fallback
+    importer_file = scripts_dir / "importer.py"
+    if existing.get("importer.py", 0) < 100:
+        importer_file.write_bytes(_IMPORTER_PY)
+        log("✅ Created scripts/importer.py")
     
-    if process_yml.exists():
-        content = process_yml.read_text()
-        # Check if it's truncated (ends with incomplete script)
-        if "#!/usr/bi" in content and not content.strip().endswith("fi"):
-            log("⚠️ Detected truncated process.yml - backing up and fixing...")
-            
-            # Create backup
-            backup_file = workflow_dir / f"process.yml.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            backup_file.write_text(content)
-            log(f"📁 Backup created: {backup_file}")
-            
-            # Replace with working version
-            working_yml = '''name: 🔧 M3U Processor - FIXED VERSION
+    # Create exporter.py fallback
+    exporter_file = scripts_dir / "exporter.py"
+    if existing.get("exporter.py", 0) < 100:
+        exporter_file.write_bytes(_EXPORTER_PY)
+        log("✅ Created scripts/exporter.py")
+
+# Written by fix_process_yml(); encoded once at import
+_PROCESS_YML = '''name: 🔧 M3U Processor - FIXED VERSION
 
 on:
   workflow_dispatch:
@@ -406,48 +567,82 @@ jobs:
           git commit -m "🔄 Updated M3U playlist - $CHANNELS channels - $(date -u '+%Y-%m-%d %H:%M:%S UTC')"
           git push
         fi
-'''
-            process_yml.write_text(working_yml)
-            log("✅ Fixed process.yml workflow")
+'''.encode('utf-8')
 
-def check_requirements():
-    """Check and create requirements.txt if missing"""
-    req_file = Path("requirements.txt")
+def fix_process_yml():
+    """Fix the truncated process.yml file"""
+    workflow_dir = Path(".github/workflows")
+    workflow_dir.mkdir(parents=True, exist_ok=True)
     
-    if not req_file.exists():
-        requirements = '''# M3U Tool Dependencies
+    # Check if process.yml is truncated
+    process_yml = workflow_dir / "process.yml"
+    
+    # One read instead of exists() + read; a missing file reads as empty
+    try:
+        content = process_yml.read_text()
+    except FileNotFoundError:
+        content = ""
+    
+    if content:
+        # Check if it's truncated (ends with incomplete script)
+        if "#!/usr/bi" in content and not content.rstrip().endswith("fi"):
+            log("⚠️ Detected truncated process.yml - backing up and fixing...")
+            
+            # Create backup
+            backup_file = workflow_dir / f"process.yml.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            backup_file.write_text(content)
+            log(f"📁 Backup created: {backup_file}")
+            
+            # Replace with working version
+            process_yml.write_bytes(_PROCESS_YML)
+            log("✅ Fixed process.yml workflow")
+
+# Written by check_requirements(); encoded once at import
+_REQUIREMENTS_TXT = '''# M3U Tool Dependencies
 requests>=2.28.0
 charset-normalizer>=3.0.0
 pycountry>=22.0.0
 lxml>=4.9.0
 beautifulsoup4>=4.11.0
-'''
-        req_file.write_text(requirements)
+# Optional: faster JSON output (stdlib json fallback built in)
+# orjson>=3.9.0
+'''.encode('utf-8')
+
+def check_requirements():
+    """Check and create requirements.txt if missing"""
+    req_file = Path("requirements.txt")
+    
+    if not req_file.exists():
+        req_file.write_bytes(_REQUIREMENTS_TXT)
         log("✅ Created requirements.txt")
 
+# Written by ensure_config_files(); encoded once at import
+_PROVIDERS_TXT = '''# M3U Provider URLs
+# Add your IPTV playlist URLs here (one per line)
+https://iptv-org.github.io/iptv/languages/eng.m3u
+https://raw.githubusercontent.com/iptv-org/iptv/master/streams/us.m3u
+'''.encode('utf-8')
+
+_EPG_SOURCES_TXT = '''# EPG Source URLs
+# Add EPG (Electronic Program Guide) URLs here
+'''.encode('utf-8')
+
 def ensure_config_files():
     """Ensure all config files exist"""
     config_dir = Path("config")
-    config_dir.mkdir(exist_ok=True)
+    config_dir.mkdir(parents=True, exist_ok=True)
+    existing = existing_file_sizes(config_dir, {"providers.txt", "epg_sources.txt"})
     
     # providers.txt
     providers_file = config_dir / "providers.txt"
-    if not providers_file.exists():
-        providers_content = '''# M3U Provider URLs
-# Add your IPTV playlist URLs here (one per line)
-https://iptv-org.github.io/iptv/languages/eng.m3u
-https://raw.githubusercontent.com/iptv-org/iptv/master/streams/us.m3u
-'''
-        providers_file.write_text(providers_content)
+    if "providers.txt" not in existing:
+        providers_file.write_bytes(_PROVIDERS_TXT)
         log("✅ Created config/providers.txt")
     
     # epg_sources.txt
     epg_file = config_dir / "epg_sources.txt"
-    if not epg_file.exists():
-        epg_content = '''# EPG Source URLs
-# Add EPG (Electronic Program Guide) URLs here
-'''
-        epg_file.write_text(epg_content)
+    if "epg_sources.txt" not in existing:
+        epg_file.write_bytes(_EPG_SOURCES_TXT)
         log("✅ Created config/epg_sources.txt")
 
 def main():
@@ -456,26 +651,37 @@ def main():
     log("="*50)
     
     try:
-        # Fix workflow first (most critical)
-        fix_process_yml()
+        # Several fixes write straight into scripts/, so make sure it exists
+        # before they run side by side
+        Path("scripts").mkdir(exist_ok=True)
         
-        # Create missing modules
-        create_missing_modules()
-        
-        # Fix country grouper
-        fix_country_grouper()
-        
-        # Create fallback imports
-        create_fallback_imports()
-        
-        # Check requirements
-        check_requirements()
-        
-        # Ensure config files
-        ensure_config_files()
+        # The fix steps touch disjoint files, so overlap their I/O. The
+        # workflow fix is still submitted first as the most critical one.
+        steps = (
+            fix_process_yml,
+            create_missing_modules,
+            fix_country_grouper,
+            create_fallback_imports,
+            check_requirements,
+            ensure_config_files,
+        )
+        # Output is buffered per step and printed in step order, so
+        # concurrent steps never interleave their log lines
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(run_buffered, step) for step in steps]
+            for future in futures:
+                lines, error = future.result()
+                for line in lines:
+                    print(line)
+                if error is not None:
+                    raise error
         
         log("="*50)
         log("✅ Quick fix completed successfully!")
+        
+        playlist = Path("playlists/final.m3u")
+        if playlist.is_file():
+            log(f"📺 Current playlist: {count_extinf(playlist)} channels")
         log("")
         log("🚀 Next steps:")
         log("1. Commit these fixes: git add . && git commit -m 'Fixed M3U tool issues'")
@@ -8,15 +8,44 @@ SUCCESS RATE: 95%+ with any M3U format variation
 """
 
 import re
+import sys
 import logging
-import hashlib
-from typing import Dict, List, Optional, Tuple, Union, Set
-from urllib.parse import urlparse, parse_qs
-from dataclasses import dataclass
+import itertools
+import multiprocessing
+from typing import Dict, Iterable, List, Optional, Tuple, Union, Set
+from urllib.parse import urlparse, parse_qs, ParseResult as URLParseResult
+from dataclasses import dataclass, field
 from enum import Enum
 import unicodedata
 import json
 
+# Precompiled hot-path regexes
+DURATION_PATTERN = re.compile(r'#EXTINF:\s*(-?\d+(?:\.\d+)?)')
+HTTP_URL_PATTERN = re.compile(r'(https?://[^\s]+)')
+URL_LIKE_PATTERN = re.compile(
+    r'^\w+://[\w\.-]+'  # Basic URL pattern
+    r'|[\w\.-]+\.\w{2,}'  # Domain pattern
+    r'|/[\w/.-]+\.\w{3,4}$'  # File path pattern
+)
+
+def _build_extinf_regex(patterns: Dict[str, str]) -> Tuple[re.Pattern, Tuple[str, ...], Dict[str, Tuple[str, ...]]]:
+    """
+    Fuse the per-attribute EXTINF patterns into one alternation
+    
+    Returns the compiled regex, the attribute name for each capture group
+    (group 1 is the first name), and for each attribute the shorter names
+    it also satisfies (tvg-logo=... is also a logo=... match).
+    """
+    names = tuple(patterns)
+    combined = re.compile('|'.join(f'(?:{pattern})' for pattern in patterns.values()), re.IGNORECASE)
+    implied = {
+        name: tuple(other for other in names
+                    if other != name and name.endswith(other)
+                    and patterns[name] == name[:-len(other)] + patterns[other])
+        for name in names
+    }
+    return combined, names, implied
+
 class M3UFormat(Enum):
     """M3U format types"""
     EXTENDED_M3U = "extended"
@@ -25,9 +54,9 @@ class M3UFormat(Enum):
     CUSTOM_DELIMITED = "custom"
     UNKNOWN = "unknown"
 
-@dataclass
+@dataclass(slots=True)
 class ParsedChannel:
-    """Universal channel data structure"""
+    """Universal channel data structure (slotted: no per-instance __dict__)"""
     name: str = ""
     url: str = ""
     group: str = "General"
@@ -37,13 +66,28 @@ class ParsedChannel:
     language: str = ""
     quality: str = ""
     duration: int = -1
-    attributes: Dict[str, str] = None
+    attributes: Dict[str, str] = field(default_factory=dict)
     
-    def __post_init__(self):
-        if self.attributes is None:
-            self.attributes = {}
+    def extinf_line(self) -> str:
+        """EXTINF line for this channel as written to M3U output"""
+        extinf_parts = ["#EXTINF:-1"]
+        
+        # Add attributes
+        if self.epg_id:
+            extinf_parts.append(f'tvg-id="{self.epg_id}"')
+        if self.logo:
+            extinf_parts.append(f'tvg-logo="{self.logo}"')
+        if self.group and self.group != 'General':
+            extinf_parts.append(f'group-title="{self.group}"')
+        if self.country:
+            extinf_parts.append(f'tvg-country="{self.country}"')
+        if self.language:
+            extinf_parts.append(f'tvg-language="{self.language}"')
+        
+        # Add name
+        return f"{' '.join(extinf_parts)},{self.name}"
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """Parse operation result"""
     channels: List[ParsedChannel]
@@ -73,6 +117,15 @@ class UniversalM3UParser:
         'file://', 'rtsp://', 'srt://', 'icecast://', 'shoutcast://'
     }
     
+    # Tuple form for a single str.startswith call
+    _PROTOCOL_TUPLE = tuple(SUPPORTED_PROTOCOLS)
+    # Longest protocol; only this much of a line needs lowercasing
+    _PROTOCOL_PREFIX_LEN = max(map(len, SUPPORTED_PROTOCOLS))
+    # Any supported protocol (ASCII case-insensitive) and the rest of its word
+    _PROTOCOL_URL_REGEX = re.compile(
+        '(?ai:' + '|'.join(map(re.escape, sorted(SUPPORTED_PROTOCOLS))) + r')\S*'
+    )
+    
     # Standard EXTINF attribute patterns - FLEXIBLE regex patterns
     EXTINF_PATTERNS = {
         'tvg-id': r'tvg-id=[\'""]?([^\'"">\s,]+)[\'""]?',
@@ -94,6 +147,32 @@ class UniversalM3UParser:
         'epg-id': r'epg-id=[\'""]?([^\'"">,]+)[\'""]?'
     }
     
+    # Compiled once at class creation so parsing never goes through the re cache
+    _COMPILED_EXTINF_PATTERNS = {
+        attr_name: re.compile(pattern, re.IGNORECASE)
+        for attr_name, pattern in EXTINF_PATTERNS.items()
+    }
+    
+    # All attribute patterns fused into one regex, so each EXTINF line is scanned once
+    _EXTINF_REGEX, _EXTINF_GROUP_NAMES, _EXTINF_IMPLIED_NAMES = _build_extinf_regex(EXTINF_PATTERNS)
+    
+    # Custom-format field delimiters, highest priority first
+    _DELIMITERS = ('|', ';', '\t', ',')
+    
+    # EXTINF attributes that map onto ParsedChannel fields
+    _STRUCTURED_ATTRS = {
+        'group-title': 'group',
+        'tvg-logo': 'logo',
+        'logo': 'logo',
+        'tvg-id': 'epg_id',
+        'epg-id': 'epg_id',
+        'tvg-country': 'country',
+        'country': 'country',
+        'tvg-language': 'language',
+        'language': 'language',
+        'quality': 'quality'
+    }
+    
     def __init__(self, strict_mode: bool = False, error_recovery: bool = True):
         """
         Initialize parser with configuration
@@ -118,33 +197,114 @@ class UniversalM3UParser:
             'recovered_lines': 0
         }
     
-    def parse(self, content: Union[str, List[str]]) -> ParseResult:
+    def parse(self, content: Union[str, Iterable[str]]) -> ParseResult:
         """
         Main parsing method - handles any M3U content
         
         Args:
-            content: M3U content as string or list of lines
+            content: M3U content as string, or any iterable of lines
+                     (list, open file object, response line iterator)
             
         Returns:
             ParseResult with channels and metadata
         """
-        # Reset statistics
-        self.stats = {k: 0 for k in self.stats.keys()}
+        lines, format_detected = self._prepare(content)
+        return self._parse_prepared(lines, format_detected, self.strict_mode)
+    
+    def parse_lines(self, lines: Iterable[str], strict: Optional[bool] = None) -> ParseResult:
+        """
+        Parse raw M3U lines, such as an open text file, without joining them
         
-        # Normalize input
-        if isinstance(content, str):
-            lines = self._normalize_content(content)
-        else:
-            lines = [line.strip() for line in content if line.strip()]
+        Each line gets the normalization parse() applies to string content
+        (BOM removal, NFKC, stripping), so the file never has to be held as
+        one string.
         
-        self.stats['total_lines'] = len(lines)
+        Args:
+            lines: Iterable of raw lines
+            strict: Overrides strict_mode for this call
+            
+        Returns:
+            ParseResult with channels and metadata
+        """
+        lines, format_detected = self._prepare(self._normalize_lines(lines))
+        return self._parse_prepared(lines, format_detected, self.strict_mode if strict is None else strict)
+    
+    def _parse_prepared(self, lines: List[str], format_detected: M3UFormat, strict: bool) -> ParseResult:
+        """Parse normalized lines of a detected format into a ParseResult"""
+        channels, errors, warnings = self._parse_by_format(lines, format_detected, strict)
         
-        # Detect format
-        format_detected = self._detect_format(lines)
-        self.logger.info(f"Detected format: {format_detected.value}")
+        return ParseResult(
+            channels=channels,
+            format_detected=format_detected,
+            total_lines=self.stats['total_lines'],
+            processed_lines=self.stats['processed_lines'],
+            errors=errors,
+            warnings=warnings,
+            statistics=self.stats
+        )
+    
+    def parse_parallel(self, content: Union[str, Iterable[str]], workers: Optional[int] = None,
+                       chunk_lines: int = 50000) -> ParseResult:
+        """
+        Parse large Extended M3U playlists across worker processes
+        
+        Lines are cut into chunks of about chunk_lines, each starting at an
+        #EXTINF line, and parsed in a multiprocessing.Pool. Chunk results are
+        merged in playlist order and duplicate URLs are dropped across chunks.
+        Other formats, and playlists that fit in one chunk, are parsed inline
+        as by parse().
         
-        # Parse based on format
-        channels, errors, warnings = self._parse_by_format(lines, format_detected, self.strict_mode)
+        Args:
+            content: M3U content as string, or any iterable of lines
+            workers: Number of worker processes (default: CPU count)
+            chunk_lines: Target number of lines per chunk
+            
+        Returns:
+            ParseResult with channels and metadata
+        """
+        lines, format_detected = self._prepare(content)
+        
+        if (format_detected not in (M3UFormat.EXTENDED_M3U, M3UFormat.MIXED_FORMAT)
+                or len(lines) <= chunk_lines):
+            channels, errors, warnings = self._parse_by_format(lines, format_detected, self.strict_mode)
+        else:
+            # Mixed format is parsed as extended, but never strictly
+            strict = self.strict_mode if format_detected == M3UFormat.EXTENDED_M3U else False
+            
+            # Cut chunks at #EXTINF lines so no EXTINF + URL pair is split
+            bounds = [0]
+            i = chunk_lines
+            while i < len(lines):
+                if lines[i].startswith('#EXTINF:'):
+                    bounds.append(i)
+                    i += chunk_lines
+                else:
+                    i += 1
+            bounds.append(len(lines))
+            tasks = [
+                (lines[lo:hi], self.strict_mode, self.error_recovery, strict)
+                for lo, hi in zip(bounds, bounds[1:])
+            ]
+            
+            channels, errors, warnings = [], [], []
+            seen_urls = set()
+            with multiprocessing.Pool(workers) as pool:
+                for chunk_channels, chunk_errors, chunk_warnings, chunk_stats, chunk_keys in pool.imap(_parse_extended_chunk, tasks):
+                    errors.extend(chunk_errors)
+                    warnings.extend(chunk_warnings)
+                    for name, count in chunk_stats.items():
+                        if name != 'total_lines':
+                            self.stats[name] += count
+                    
+                    # Chunks dedupe internally; drop URLs an earlier chunk already took
+                    for channel, url_key in zip(chunk_channels, chunk_keys):
+                        if url_key is None:
+                            channels.append(channel)
+                        elif url_key not in seen_urls:
+                            channels.append(channel)
+                            seen_urls.add(url_key)
+                        else:
+                            warnings.append(f"Duplicate URL skipped: {channel.url}")
         
         return ParseResult(
             channels=channels,
@@ -156,34 +316,87 @@ class UniversalM3UParser:
             statistics=self.stats
         )
     
+    def _prepare(self, content: Union[str, Iterable[str]]) -> Tuple[List[str], M3UFormat]:
+        """Reset statistics, normalize input into lines and detect their format"""
+        # Reset statistics
+        self.stats = {k: 0 for k in self.stats.keys()}
+        
+        # Normalize input
+        if isinstance(content, str):
+            lines = self._normalize_content(content)
+        else:
+            lines = [stripped for stripped in (line.strip() for line in content) if stripped]
+        
+        self.stats['total_lines'] = len(lines)
+        
+        # Detect format
+        format_detected = self._detect_format(lines)
+        self.logger.info(f"Detected format: {format_detected.value}")
+        
+        return lines, format_detected
+    
     def _normalize_content(self, content: str) -> List[str]:
-        """Normalize M3U content for parsing"""
+        """
+        Normalize M3U content for parsing
+        
+        Every returned line is stripped and non-empty; the format parsers
+        rely on this and do not strip again.
+        """
         # Remove BOM if present
         if content.startswith('\ufeff'):
             content = content[1:]
         
-        # Normalize Unicode
-        content = unicodedata.normalize('NFKC', content)
+        # Normalize Unicode (ASCII text is already NFKC, and isascii() is O(1))
+        if not content.isascii():
+            content = unicodedata.normalize('NFKC', content)
         
-        # Split into lines and clean
-        lines = []
-        for line in content.replace('\r\n', '\n').replace('\r', '\n').split('\n'):
-            line = line.strip()
-            if line:  # Skip empty lines during normalization
-                lines.append(line)
+        # Only copy the content to normalize line endings when it has a '\r'
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         
-        return lines
+        # Split into lines and clean, skipping empty lines
+        return [stripped for stripped in (line.strip() for line in content.split('\n')) if stripped]
+    
+    @staticmethod
+    def _normalize_lines(lines: Iterable[str]) -> Iterable[str]:
+        """Per-line equivalent of _normalize_content for raw line iterables"""
+        first = True
+        for line in lines:
+            if first:
+                first = False
+                if line.startswith('\ufeff'):
+                    line = line[1:]
+            if not line.isascii():
+                line = unicodedata.normalize('NFKC', line)
+            line = line.strip()
+            if '\n' in line or '\r' in line:
+                # Raw iterables may hold several lines in one item
+                for piece in line.replace('\r\n', '\n').replace('\r', '\n').split('\n'):
+                    piece = piece.strip()
+                    if piece:
+                        yield piece
+            elif line:
+                yield line
     
     def _detect_format(self, lines: List[str]) -> M3UFormat:
         """Detect M3U format type"""
         if not lines:
             return M3UFormat.UNKNOWN
         
-        # Count different line types
-        extinf_count = sum(1 for line in lines if line.upper().startswith('#EXTINF'))
-        url_count = sum(1 for line in lines if self._looks_like_url(line))
-        header_count = sum(1 for line in lines if line.upper().startswith('#EXTM3U'))
-        delimiter_count = sum(1 for line in lines if '|' in line or ';' in line or '\t' in line)
+        # Count different line types in a single pass
+        extinf_count = url_count = header_count = delimiter_count = 0
+        looks_like_url = self._looks_like_url
+        for line in lines:
+            head = line[:7].upper()
+            if head.startswith('#EXTINF'):
+                extinf_count += 1
+            elif head.startswith('#EXTM3U'):
+                header_count += 1
+            # EXTINF lines can carry URL-like attributes, so every line is checked
+            if looks_like_url(line):
+                url_count += 1
+            if '|' in line or ';' in line or '\t' in line:
+                delimiter_count += 1
         
         # Format detection logic
         if extinf_count > 0:
@@ -211,40 +424,51 @@ class UniversalM3UParser:
         else:
             return self._parse_unknown_format(lines, strict)
     
-    def _parse_extended_m3u(self, lines: List[str], strict: bool) -> Tuple[List[ParsedChannel], List[str], List[str]]:
-        """Parse Extended M3U format (#EXTINF + URL pairs)"""
+    def _parse_extended_m3u(self, lines: List[str], strict: bool,
+                            pair_keys: Optional[List[Optional[str]]] = None) -> Tuple[List[ParsedChannel], List[str], List[str]]:
+        """
+        Parse Extended M3U format (#EXTINF + URL pairs)
+        
+        If pair_keys is given, it receives one entry per returned channel: the
+        dedup key for EXTINF + URL channels, None for minimal/recovered ones.
+        """
         channels = []
         errors = []
         warnings = []
         
-        i = 0
+        start = 0
         if lines and lines[0].upper().startswith('#EXTM3U'):
-            i = 1  # Skip header
+            start = 1  # Skip header
         
         current_extinf = None
         processed_urls = set()
         
-        while i < len(lines):
-            line = lines[i].strip()
-            
+        # Hot loop: bind lookups locally and tally counters in locals,
+        # folding them into self.stats once at the end
+        looks_like_url = self._looks_like_url
+        parse_extinf_pair = self._parse_extinf_pair
+        add_channel = channels.append
+        extinf_lines = url_lines = comment_lines = malformed_lines = recovered_lines = 0
+        
+        for line in itertools.islice(lines, start, None):
             if line.startswith('#EXTINF:'):
                 current_extinf = line
-                self.stats['extinf_lines'] += 1
-                self.stats['processed_lines'] += 1
+                extinf_lines += 1
                 
-            elif self._looks_like_url(line):
-                self.stats['url_lines'] += 1
-                self.stats['processed_lines'] += 1
+            elif looks_like_url(line):
+                url_lines += 1
                 
                 if current_extinf:
                     # Parse EXTINF + URL pair
-                    channel = self._parse_extinf_pair(current_extinf, line)
+                    channel = parse_extinf_pair(current_extinf, line)
                     if channel:
-                        # Check for duplicates
-                        url_hash = hashlib.md5(channel.url.lower().encode()).hexdigest()
-                        if url_hash not in processed_urls:
-                            channels.append(channel)
-                            processed_urls.add(url_hash)
+                        # Check for duplicates (case-insensitive URL)
+                        url_key = channel.url.lower()
+                        if url_key not in processed_urls:
+                            add_channel(channel)
+                            processed_urls.add(url_key)
+                            if pair_keys is not None:
+                                pair_keys.append(url_key)
                         else:
                             warnings.append(f"Duplicate URL skipped: {line}")
                     current_extinf = None
@@ -252,25 +476,35 @@ class UniversalM3UParser:
                     # URL without EXTINF - create minimal channel
                     channel = self._create_minimal_channel(line)
                     if channel:
-                        channels.append(channel)
+                        add_channel(channel)
+                        if pair_keys is not None:
+                            pair_keys.append(None)
                         
             elif line.startswith('#'):
-                self.stats['comment_lines'] += 1
+                comment_lines += 1
                 # Skip other comments
                 
             else:
-                self.stats['malformed_lines'] += 1
+                malformed_lines += 1
                 if self.error_recovery:
                     # Try to recover malformed line
                     recovered = self._attempt_line_recovery(line)
                     if recovered:
-                        channels.append(recovered)
-                        self.stats['recovered_lines'] += 1
+                        add_channel(recovered)
+                        if pair_keys is not None:
+                            pair_keys.append(None)
+                        recovered_lines += 1
                         warnings.append(f"Recovered malformed line: {line}")
                 elif strict:
                     errors.append(f"Malformed line: {line}")
-            
-            i += 1
+        
+        stats = self.stats
+        stats['extinf_lines'] += extinf_lines
+        stats['url_lines'] += url_lines
+        stats['processed_lines'] += extinf_lines + url_lines
+        stats['comment_lines'] += comment_lines
+        stats['malformed_lines'] += malformed_lines
+        stats['recovered_lines'] += recovered_lines
         
         return channels, errors, warnings
     
@@ -279,10 +513,9 @@ class UniversalM3UParser:
         channels = []
         errors = []
         warnings = []
+        processed_lines = malformed_lines = recovered_lines = 0
         
         for line in lines:
-            line = line.strip()
-            
             if not line or line.startswith('#'):
                 continue
                 
@@ -290,14 +523,20 @@ class UniversalM3UParser:
                 channel = self._create_minimal_channel(line)
                 if channel:
                     channels.append(channel)
-                    self.stats['processed_lines'] += 1
+                    processed_lines += 1
             else:
-                self.stats['malformed_lines'] += 1
+                malformed_lines += 1
                 if self.error_recovery:
                     recovered = self._attempt_line_recovery(line)
                     if recovered:
                         channels.append(recovered)
-                        self.stats['recovered_lines'] += 1
+                        recovered_lines += 1
+        
+        # Counters are kept in locals and folded into self.stats once
+        stats = self.stats
+        stats['processed_lines'] += processed_lines
+        stats['malformed_lines'] += malformed_lines
+        stats['recovered_lines'] += recovered_lines
         
         return channels, errors, warnings
     
@@ -313,21 +552,23 @@ class UniversalM3UParser:
         warnings = []
         
         for line in lines:
-            line = line.strip()
             if not line or line.startswith('#'):
                 continue
             
-            # Try different delimiters
-            for delimiter in ['|', ';', '\t', ',']:
+            # Try different delimiters, in priority order
+            for delimiter in self._DELIMITERS:
                 if delimiter in line:
-                    parts = [part.strip() for part in line.split(delimiter)]
+                    # Only the first four fields are used; the remainder stays unsplit
+                    parts = [part.strip() for part in line.split(delimiter, 4)]
                     if len(parts) >= 2:
                         channel = self._parse_delimited_parts(parts)
                         if channel:
                             channels.append(channel)
-                            self.stats['processed_lines'] += 1
                             break
         
+        # Every parsed channel is one processed line
+        self.stats['processed_lines'] += len(channels)
+        
         return channels, errors, warnings
     
     def _parse_unknown_format(self, lines: List[str], strict: bool) -> Tuple[List[ParsedChannel], List[str], List[str]]:
@@ -337,7 +578,6 @@ class UniversalM3UParser:
         warnings = []
         
         for line in lines:
-            line = line.strip()
             if not line or line.startswith('#EXTM3U'):
                 continue
             
@@ -359,7 +599,7 @@ class UniversalM3UParser:
         """Parse EXTINF + URL pair into channel"""
         try:
             # Parse duration from EXTINF
-            duration_match = re.search(r'#EXTINF:\s*(-?\d+(?:\.\d+)?)', extinf_line)
+            duration_match = DURATION_PATTERN.search(extinf_line)
             duration = int(float(duration_match.group(1))) if duration_match else -1
             
             # Extract attributes and title
@@ -371,17 +611,7 @@ class UniversalM3UParser:
             if comma_pos != -1:
                 attr_and_title = extinf_line[comma_pos + 1:].strip()
                 
-                # Extract attributes using patterns
-                for attr_name, pattern in self.EXTINF_PATTERNS.items():
-                    match = re.search(pattern, attr_and_title, re.IGNORECASE)
-                    if match:
-                        attributes[attr_name] = match.group(1).strip('\'"')
-                
-                # Extract title (everything after last attribute or comma)
-                title = attr_and_title
-                for attr_name, pattern in self.EXTINF_PATTERNS.items():
-                    title = re.sub(pattern, '', title, flags=re.IGNORECASE)
-                title = title.strip(', \t')
+                attributes, title = self._extract_extinf_attributes(attr_and_title)
             
             # Create channel
             channel = ParsedChannel(
@@ -391,13 +621,22 @@ class UniversalM3UParser:
                 attributes=attributes
             )
             
-            # Map common attributes to structured fields
-            channel.group = attributes.get('group-title', 'General')
+            # Map common attributes to structured fields; the low-cardinality
+            # ones are interned so repeated values share one string object
+            channel.group = sys.intern(attributes.get('group-title', 'General'))
             channel.logo = attributes.get('tvg-logo', attributes.get('logo', ''))
             channel.epg_id = attributes.get('tvg-id', attributes.get('epg-id', ''))
-            channel.country = attributes.get('tvg-country', attributes.get('country', ''))
-            channel.language = attributes.get('tvg-language', attributes.get('language', ''))
-            channel.quality = attributes.get('quality', '')
+            channel.country = sys.intern(attributes.get('tvg-country', attributes.get('country', '')))
+            channel.language = sys.intern(attributes.get('tvg-language', attributes.get('language', '')))
+            channel.quality = sys.intern(attributes.get('quality', ''))
+            
+            # Keep only attributes the structured fields don't already hold
+            if attributes:
+                structured = self._STRUCTURED_ATTRS
+                channel.attributes = {
+                    key: value for key, value in attributes.items()
+                    if key not in structured or getattr(channel, structured[key]) != value
+                }
             
             return channel
             
@@ -406,13 +645,59 @@ class UniversalM3UParser:
             # Fallback to minimal channel
             return self._create_minimal_channel(url_line)
     
+    def _extract_extinf_attributes(self, attr_and_title: str) -> Tuple[Dict[str, str], str]:
+        """Extract attributes and title from the text after the EXTINF comma in one scan"""
+        found = {}
+        title_parts = []
+        last_end = 0
+        
+        for match in self._EXTINF_REGEX.finditer(attr_and_title):
+            raw_value = match.group(match.lastindex)
+            if '=' in raw_value:
+                # An unquoted value swallowed what may be further attributes;
+                # only the per-pattern scan sees those
+                return self._extract_extinf_attributes_per_pattern(attr_and_title)
+            
+            # The first occurrence of each attribute wins
+            attr_name = self._EXTINF_GROUP_NAMES[match.lastindex - 1]
+            value = raw_value.strip('\'"')
+            found.setdefault(attr_name, value)
+            for implied_name in self._EXTINF_IMPLIED_NAMES[attr_name]:
+                found.setdefault(implied_name, value)
+            
+            title_parts.append(attr_and_title[last_end:match.start()])
+            last_end = match.end()
+        title_parts.append(attr_and_title[last_end:])
+        
+        # Keep attributes in EXTINF_PATTERNS order
+        attributes = {name: found[name] for name in self.EXTINF_PATTERNS if name in found}
+        
+        # Title is everything left once the attributes are removed
+        return attributes, ''.join(title_parts).strip(', \t')
+    
+    def _extract_extinf_attributes_per_pattern(self, attr_and_title: str) -> Tuple[Dict[str, str], str]:
+        """Extract attributes and title with one search and one sub per attribute pattern"""
+        attributes = {}
+        for attr_name, pattern in self._COMPILED_EXTINF_PATTERNS.items():
+            match = pattern.search(attr_and_title)
+            if match:
+                attributes[attr_name] = match.group(1).strip('\'"')
+        
+        # Extract title (everything after last attribute or comma)
+        title = attr_and_title
+        for pattern in self._COMPILED_EXTINF_PATTERNS.values():
+            title = pattern.sub('', title)
+        
+        return attributes, title.strip(', \t')
+    
     def _create_minimal_channel(self, url: str) -> Optional[ParsedChannel]:
         """Create minimal channel from URL only"""
-        if not self._is_valid_url(url):
+        parsed = self._split_url(url)
+        if not self._is_valid_url(url, parsed):
             return None
         
         return ParsedChannel(
-            name=self._extract_name_from_url(url),
+            name=self._extract_name_from_url(url, parsed),
             url=url
         )
     
@@ -438,7 +723,7 @@ class UniversalM3UParser:
         channel = ParsedChannel(name=name, url=url)
         
         if len(parts) > 2:
-            channel.group = parts[2]
+            channel.group = sys.intern(parts[2])
         if len(parts) > 3:
             channel.logo = parts[3]
         
@@ -447,29 +732,30 @@ class UniversalM3UParser:
     def _attempt_line_recovery(self, line: str) -> Optional[ParsedChannel]:
         """Attempt to recover a malformed line"""
         # Strategy 1: Look for URL in the line
-        url_match = re.search(r'(https?://[^\s]+)', line)
+        url_match = HTTP_URL_PATTERN.search(line)
         if url_match:
             url = url_match.group(1)
-            if self._is_valid_url(url):
+            parsed = self._split_url(url)
+            if self._is_valid_url(url, parsed):
                 # Extract potential name
                 name = line.replace(url, '').strip(' |,;:\t#')
                 return ParsedChannel(
-                    name=name or self._extract_name_from_url(url),
+                    name=name or self._extract_name_from_url(url, parsed),
                     url=url
                 )
         
-        # Strategy 2: Look for streaming protocols
-        for protocol in self.SUPPORTED_PROTOCOLS:
-            if protocol in line.lower():
-                # Try to extract URL
-                start = line.lower().find(protocol)
-                url_part = line[start:].split()[0]  # Get first word starting with protocol
-                if self._is_valid_url(url_part):
-                    name = line[:start].strip(' |,;:\t#')
-                    return ParsedChannel(
-                        name=name or self._extract_name_from_url(url_part),
-                        url=url_part
-                    )
+        # Strategy 2: Look for streaming protocols, leftmost first
+        if '://' not in line:
+            return None
+        for protocol_match in self._PROTOCOL_URL_REGEX.finditer(line):
+            url_part = protocol_match.group()  # Word starting with the protocol
+            parsed = self._split_url(url_part)
+            if self._is_valid_url(url_part, parsed):
+                name = line[:protocol_match.start()].strip(' |,;:\t#')
+                return ParsedChannel(
+                    name=name or self._extract_name_from_url(url_part, parsed),
+                    url=url_part
+                )
         
         return None
     
@@ -478,37 +764,32 @@ class UniversalM3UParser:
         if not line:
             return False
         
-        line_lower = line.lower()
-        
         # Check for protocols
-        for protocol in self.SUPPORTED_PROTOCOLS:
-            if line_lower.startswith(protocol):
-                return True
+        if line[:self._PROTOCOL_PREFIX_LEN].lower().startswith(self._PROTOCOL_TUPLE):
+            return True
         
         # Check for common URL patterns
-        url_patterns = [
-            r'^\w+://[\w\.-]+',  # Basic URL pattern
-            r'[\w\.-]+\.\w{2,}',  # Domain pattern
-            r'/[\w/.-]+\.\w{3,4}$'  # File path pattern
-        ]
-        
-        for pattern in url_patterns:
-            if re.search(pattern, line):
-                return True
-        
-        return False
+        return URL_LIKE_PATTERN.search(line) is not None
     
-    def _is_valid_url(self, url: str) -> bool:
-        """Validate URL format"""
+    def _split_url(self, url: str) -> Optional[URLParseResult]:
+        """urlparse() a URL once so validation and naming can share the result; None if unparseable"""
+        try:
+            return urlparse(url)
+        except ValueError:
+            return None
+    
+    def _is_valid_url(self, url: str, parsed: Optional[URLParseResult] = None) -> bool:
+        """Validate URL format, reusing an already parsed URL when given"""
         if not url:
             return False
         
         try:
-            parsed = urlparse(url)
+            if parsed is None:
+                parsed = urlparse(url)
             
             # Check scheme
             if parsed.scheme:
-                if not any(url.lower().startswith(protocol) for protocol in self.SUPPORTED_PROTOCOLS):
+                if not url[:self._PROTOCOL_PREFIX_LEN].lower().startswith(self._PROTOCOL_TUPLE):
                     return False
             
             # Must have some path or query
@@ -520,10 +801,11 @@ class UniversalM3UParser:
         except Exception:
             return False
     
-    def _extract_name_from_url(self, url: str) -> str:
-        """Extract meaningful name from URL"""
+    def _extract_name_from_url(self, url: str, parsed: Optional[URLParseResult] = None) -> str:
+        """Extract meaningful name from URL, reusing an already parsed URL when given"""
         try:
-            parsed = urlparse(url)
+            if parsed is None:
+                parsed = urlparse(url)
             
             # Try to get filename
             path = parsed.path
@@ -544,6 +826,14 @@ class UniversalM3UParser:
         except Exception:
             return "Unknown Channel"
 
+def _parse_extended_chunk(task):
+    """Pool worker for parse_parallel: parse one chunk of Extended M3U lines"""
+    lines, strict_mode, error_recovery, strict = task
+    parser = UniversalM3UParser(strict_mode=strict_mode, error_recovery=error_recovery)
+    pair_keys = []
+    channels, errors, warnings = parser._parse_extended_m3u(lines, strict, pair_keys)
+    return channels, errors, warnings, parser.stats, pair_keys
+
 # Example usage and testing
 if __name__ == "__main__":
     # Test the parser with various M3U formats
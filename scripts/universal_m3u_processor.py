@@ -6,24 +6,136 @@ Handles all M3U formats, provides comprehensive processing capabilities
 
 import os
 import re
+import itertools
+from collections import Counter
 import json
 import logging
 import asyncio
 import aiohttp
-import hashlib
 import time
-from typing import Dict, List, Optional, Set, Tuple, Union
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from dataclasses import dataclass, asdict, replace
+from enum import Enum
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import urlparse, ParseResult
 import unicodedata
 from concurrent.futures import ThreadPoolExecutor
 import xml.etree.ElementTree as ET
 
 # Import our universal components
-from universal_m3u_parser import UniversalM3UParser, ParsedChannel, M3UFormat
+from universal_m3u_parser import UniversalM3UParser, ParsedChannel, M3UFormat, ParseResult as M3UParseResult
 from comprehensive_validator import ComprehensiveM3UValidator, ValidationLevel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process, utils as fuzz_utils
+except ImportError:
+    fuzz = None
+
+# EXTINF attribute artifacts left in channel names, compiled once
+TVG_ATTR_PATTERN = re.compile(r'tvg-[^=]*="[^"]*"')
+GROUP_TITLE_ATTR_PATTERN = re.compile(r'group-title="[^"]*"')
+RADIO_ATTR_PATTERN = re.compile(r'radio="[^"]*"')
+HTML_ENTITY_PATTERN = re.compile(r'&[a-zA-Z0-9#]+;')
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+
+# URL scheme as urlparse() accepts it (for URLs without whitespace or control characters)
+URL_SCHEME_PATTERN = re.compile(r'([A-Za-z][A-Za-z0-9+.\-]*):')
+
+# Canonical group names by lowercased group, built once
+GROUP_CANON = {
+    'entertainment': 'Entertainment', 'general': 'Entertainment', 'misc': 'Entertainment', 'other': 'Entertainment',
+    'news': 'News', 'news & politics': 'News',
+    'sports': 'Sports', 'sport': 'Sports',
+    'movies': 'Movies', 'films': 'Movies', 'cinema': 'Movies',
+    'kids': 'Kids', 'children': 'Kids', 'cartoon': 'Kids',
+    'music': 'Music', 'audio': 'Music'
+}
+
+# Group names by country code, built once
+COUNTRY_GROUP_NAMES = {
+    'US': 'USA', 'UK': 'United Kingdom', 'CA': 'Canada', 'AU': 'Australia',
+    'DE': 'Germany', 'FR': 'France', 'IT': 'Italy', 'ES': 'Spain',
+    'BR': 'Brazil', 'IN': 'India', 'CN': 'China', 'JP': 'Japan',
+    'KR': 'South Korea', 'RU': 'Russia', 'TR': 'Turkey', 'AR': 'Argentina',
+    'MX': 'Mexico', 'NL': 'Netherlands', 'SE': 'Sweden', 'NO': 'Norway',
+    'DK': 'Denmark', 'FI': 'Finland', 'BE': 'Belgium', 'CH': 'Switzerland',
+    'AT': 'Austria', 'PT': 'Portugal', 'GR': 'Greece', 'PL': 'Poland'
+}
+
+# One token of a keyword pattern body: a letter/digit or a [class], optionally followed by ?
+KEYWORD_TOKEN_PATTERN = re.compile(r'([a-z0-9]|\[[^\]\\^-]+\])(\?)?')
+
+def _expand_keyword_pattern(pattern: str) -> Optional[Set[str]]:
+    """
+    Expand a \\bword\\b pattern made only of literals, [classes] and ? into
+    the set of words it matches, or None if it needs the regex engine
+    """
+    if not (pattern.startswith(r'\b') and pattern.endswith(r'\b')):
+        return None
+    body = pattern[2:-2]
+    choices = []
+    pos = 0
+    for token in KEYWORD_TOKEN_PATTERN.finditer(body):
+        if token.start() != pos:
+            return None
+        pos = token.end()
+        chars = list(token.group(1).strip('[]'))
+        if token.group(2):
+            chars.append('')
+        choices.append(chars)
+    if pos != len(body) or not choices:
+        return None
+    return {''.join(parts) for parts in itertools.product(*choices)}
+
+# Word tokens as \b sees them, and the literal head a residual pattern cannot match without
+WORD_PATTERN = re.compile(r'\w+')
+LITERAL_HEAD_PATTERN = re.compile(r'(?:[a-z0-9](?!\?))*')
+
+# Lowercase characters IGNORECASE matches to a different keyword letter
+KEYWORD_CASE_FOLD = str.maketrans({'ı': 'i', 'ſ': 's'})
+
+def _build_keyword_sets(patterns: Dict[str, List[str]]) -> List[Tuple[str, frozenset, Tuple[Tuple[str, re.Pattern], ...]]]:
+    """
+    Turn {key: [regex, ...]} into [(key, words, residual)] in key order
+    
+    words holds every word the key's literal \\bword\\b patterns match, so a
+    pattern hits iff one of the text's \\w+ tokens is in it. residual keeps the
+    other patterns compiled, each with a literal head to test before searching.
+    """
+    keyword_sets = []
+    for key, key_patterns in patterns.items():
+        words = set()
+        residual = []
+        for pattern in key_patterns:
+            expanded = _expand_keyword_pattern(pattern)
+            if expanded is None:
+                head = LITERAL_HEAD_PATTERN.match(pattern[2:] if pattern.startswith(r'\b') else pattern).group()
+                residual.append((head, re.compile(pattern, re.IGNORECASE)))
+            else:
+                words |= expanded
+        keyword_sets.append((key, frozenset(words), tuple(residual)))
+    return keyword_sets
+
+def _match_keyword_sets(text: str, keyword_sets) -> Optional[str]:
+    """First key (in order) with any pattern matching in text, as re.IGNORECASE would find it"""
+    text = text.lower()
+    if not text.isascii():
+        text = text.translate(KEYWORD_CASE_FOLD)
+    words = set(WORD_PATTERN.findall(text))
+    for key, keywords, residual in keyword_sets:
+        if not keywords.isdisjoint(words):
+            return key
+        # The few \s* patterns are only searched when their literal head occurs
+        for head, pattern in residual:
+            if head in text and pattern.search(text):
+                return key
+    return None
+
 class ProcessingMode(Enum):
     """Processing operation modes"""
     IMPORT = "import"
@@ -34,13 +146,14 @@ class ProcessingMode(Enum):
     EXPORT = "export"
     FULL_PIPELINE = "full_pipeline"
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingConfig:
     """Configuration for M3U processing"""
     # Input/Output
     input_file: str = ""
     output_file: str = "processed_playlist.m3u"
     backup_enabled: bool = True
+    backup_hardlink: bool = False  # True links instead of copying; in-place writes then hit the backup too
     
     # Processing options
     strict_validation: bool = False
@@ -50,7 +163,7 @@ class ProcessingConfig:
     fix_encoding: bool = True
     
     # Duplicate detection
-    duplicate_detection_method: str = "url_similarity"  # url_exact, url_similarity, name_similarity, metadata
+    duplicate_detection_method: str = "url_similarity"  # url_exact, url_similarity, name_similarity, name_fuzzy, metadata
     similarity_threshold: float = 0.85
     
     # Categorization
@@ -81,7 +194,7 @@ class ProcessingConfig:
         if self.required_protocols is None:
             self.required_protocols = ['http://', 'https://', 'rtmp://', 'rtmps://']
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingStats:
     """Statistics from processing operation"""
     input_channels: int = 0
@@ -116,10 +229,22 @@ class UniversalM3UProcessor:
         self.processed_channels: List[ParsedChannel] = []
         self.duplicate_groups: List[List[int]] = []
         
+        # urlparse() results by URL, shared by the import and dedup stages of
+        # one run so each URL is parsed once; emptied when process_file returns
+        self._parsed_urls: Dict[str, ParseResult] = {}
+        
+        # Stream-probe HTTP state, created on first use and kept across
+        # process_file calls until aclose()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._probe_sem: Optional[asyncio.Semaphore] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Categorization patterns
         self.country_patterns = self._load_country_patterns()
         self.quality_patterns = self._load_quality_patterns()
         self.genre_patterns = self._load_genre_patterns()
+        self._country_keywords = _build_keyword_sets(self.country_patterns)
+        self._quality_keywords = _build_keyword_sets(self.quality_patterns)
     
     def _setup_logging(self) -> logging.Logger:
         """Setup logging configuration"""
@@ -153,7 +278,7 @@ class UniversalM3UProcessor:
             
             # Create backup if enabled
             if self.config.backup_enabled:
-                self._create_backup(input_file)
+                await asyncio.to_thread(self._create_backup, input_file)
             
             # Parse input file
             channels = await self._parse_input_file(input_file)
@@ -196,18 +321,17 @@ class UniversalM3UProcessor:
         except Exception as e:
             self.logger.error(f"Processing failed: {e}")
             raise
+        
+        finally:
+            # The parsed URLs (tens of MB per 100k URLs) are only needed
+            # within this run
+            self._parsed_urls.clear()
     
     async def _parse_input_file(self, input_file: str) -> List[ParsedChannel]:
         """Parse input file using universal parser"""
         try:
-            with open(input_file, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-            
-            # Handle encoding issues
-            if self.config.fix_encoding:
-                content = self._fix_encoding_issues(content)
-            
-            parse_result = self.parser.parse_content(content, self.config.strict_validation)
+            # Stream and parse in a worker thread so the event loop stays free
+            parse_result = await asyncio.to_thread(self._parse_input_lines, input_file)
             
             # Store format info
             if hasattr(self.parser, 'last_format_detected'):
@@ -226,6 +350,13 @@ class UniversalM3UProcessor:
             self.logger.error(f"Failed to parse input file: {e}")
             raise
     
+    def _parse_input_lines(self, input_file: str) -> M3UParseResult:
+        """Blocking body of _parse_input_file: feed the file to the parser line by line"""
+        # Text mode turns \r\n and \r into \n, so the whole file is never held as one string
+        with open(input_file, 'r', encoding='utf-8', errors='replace') as f:
+            lines = self._fix_encoding_issues(f) if self.config.fix_encoding else f
+            return self.parser.parse_lines(lines, self.config.strict_validation)
+    
     async def _import_channels(self, channels: List[ParsedChannel]) -> List[ParsedChannel]:
         """Import and basic processing of channels"""
         imported = []
@@ -243,21 +374,34 @@ class UniversalM3UProcessor:
     async def _clean_channels(self, channels: List[ParsedChannel]) -> List[ParsedChannel]:
         """Clean and normalize channel data"""
         cleaned = []
+        clean_name = self._clean_channel_name
+        clean_url = self._clean_url
+        
+        # Groups, logos and EPG IDs repeat across a playlist; the cleaners are
+        # pure, so each distinct value is cleaned once per batch
+        groups: Dict[str, str] = {}
+        logos: Dict[str, str] = {}
+        epg_ids: Dict[str, str] = {}
         
         for channel in channels:
-            # Create cleaned copy
-            clean_channel = ParsedChannel(
-                name=self._clean_channel_name(channel.name),
-                url=self._clean_url(channel.url),
-                group=self._clean_group_name(channel.group),
-                logo=self._clean_logo_url(channel.logo),
-                epg_id=self._clean_epg_id(channel.epg_id),
-                country=channel.country,
-                language=channel.language,
-                quality=channel.quality,
-                duration=channel.duration,
-                attributes=channel.attributes.copy() if channel.attributes else {}
-            )
+            name = clean_name(channel.name)
+            url = clean_url(channel.url)
+            
+            group = groups.get(channel.group)
+            if group is None:
+                group = groups[channel.group] = self._clean_group_name(channel.group)
+            logo = logos.get(channel.logo)
+            if logo is None:
+                logo = logos[channel.logo] = self._clean_logo_url(channel.logo)
+            epg_id = epg_ids.get(channel.epg_id)
+            if epg_id is None:
+                epg_id = epg_ids[channel.epg_id] = self._clean_epg_id(channel.epg_id)
+            
+            # Copy the channel only if cleaning changed something
+            if (name, url, group, logo, epg_id) == (channel.name, channel.url, channel.group, channel.logo, channel.epg_id):
+                clean_channel = channel
+            else:
+                clean_channel = replace(channel, name=name, url=url, group=group, logo=logo, epg_id=epg_id)
             
             # Apply cleaning rules
             if self._is_channel_valid_after_cleaning(clean_channel):
@@ -270,49 +414,84 @@ class UniversalM3UProcessor:
     
     async def _validate_channels(self, channels: List[ParsedChannel]) -> None:
         """Validate channels using comprehensive validator"""
-        # Create temporary file for validation
-        temp_file = "temp_validation.m3u"
-        await self._write_m3u_file(channels, temp_file)
+        # Validate the channels in memory; no temp file and no re-parse
+        validation_level = ValidationLevel.STRICT if self.config.test_connectivity else ValidationLevel.STANDARD
+        report = await self.validator.validate_channels(channels, validation_level)
         
-        try:
-            validation_level = ValidationLevel.DEEP if self.config.test_connectivity else ValidationLevel.ADVANCED
-            report = await self.validator.validate_file(temp_file, validation_level)
-            
-            self.stats.quality_score = report.quality_score
-            
-            # Log validation results
-            self.logger.info(f"Validation completed - Quality Score: {report.quality_score}/100")
-            self.logger.info(f"Issues found: {len(report.issues)}")
-            
-            for issue in report.issues:
-                if issue.type.value == 'error':
-                    self.logger.error(f"Validation error: {issue.message}")
-                elif issue.type.value == 'warning':
-                    self.logger.warning(f"Validation warning: {issue.message}")
+        self.stats.quality_score = report.quality_score
         
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+        # Log validation results
+        self.logger.info(f"Validation completed - Quality Score: {report.quality_score}/100")
+        self.logger.info(f"Issues found: {len(report.issues)}")
+        
+        for issue in report.issues:
+            if issue.type.value == 'error':
+                self.logger.error(f"Validation error: {issue.message}")
+            elif issue.type.value == 'warning':
+                self.logger.warning(f"Validation warning: {issue.message}")
     
     async def _deduplicate_channels(self, channels: List[ParsedChannel]) -> List[ParsedChannel]:
         """Remove duplicate channels"""
         if not self.config.remove_duplicates:
             return channels
         
+        if self.config.duplicate_detection_method == "name_fuzzy":
+            if fuzz is not None:
+                return self._fuzzy_deduplicate_channels(channels)
+            self.logger.warning("rapidfuzz not installed, falling back to name_similarity")
+        
         duplicates_removed = 0
         seen_signatures = set()
         unique_channels = []
+        generate_signature = self._generate_channel_signature
+        debug = self.logger.debug
         
         for channel in channels:
-            signature = self._generate_channel_signature(channel)
+            signature = generate_signature(channel)
             
             if signature not in seen_signatures:
                 seen_signatures.add(signature)
                 unique_channels.append(channel)
             else:
                 duplicates_removed += 1
-                self.logger.debug(f"Removed duplicate: {channel.name}")
+                debug("Removed duplicate: %s", channel.name)
+        
+        self.stats.duplicates_found = duplicates_removed
+        self.logger.info(f"Removed {duplicates_removed} duplicate channels")
+        return unique_channels
+    
+    def _fuzzy_deduplicate_channels(self, channels: List[ParsedChannel], block_size: int = 1024) -> List[ParsedChannel]:
+        """
+        Remove channels whose names score above similarity_threshold against an earlier one
+        
+        Every name is scored against every other, so the cost is O(n^2) in the
+        channel count. Each block's uint8 score matrix takes block_size x n
+        bytes: about 1 GB per block at 1M channels with the default block_size.
+        """
+        names = [fuzz_utils.default_process(channel.name) for channel in channels]
+        score_cutoff = int(self.config.similarity_threshold * 100)
+        
+        # Union-find over matching pairs; the root of each cluster is its first channel
+        parent = list(range(len(channels)))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        # Score rows in blocks so the match matrix stays block_size x n bytes
+        for start in range(0, len(names), block_size):
+            scores = fuzz_process.cdist(names[start:start + block_size], names,
+                                        scorer=fuzz.token_set_ratio, score_cutoff=score_cutoff,
+                                        dtype='uint8', workers=-1)
+            for row, col in zip(*scores.nonzero()):
+                i, j = find(start + int(row)), find(int(col))
+                if i != j:
+                    parent[max(i, j)] = min(i, j)
+        
+        unique_channels = [channel for i, channel in enumerate(channels) if find(i) == i]
+        duplicates_removed = len(channels) - len(unique_channels)
         
         self.stats.duplicates_found = duplicates_removed
         self.logger.info(f"Removed {duplicates_removed} duplicate channels")
@@ -321,42 +500,52 @@ class UniversalM3UProcessor:
     async def _categorize_channels(self, channels: List[ParsedChannel]) -> List[ParsedChannel]:
         """Auto-categorize channels by country, quality, genre"""
         categorized = []
+        detect_countries = self.config.auto_detect_countries
+        detect_quality = self.config.auto_detect_quality
+        normalize_groups = self.config.normalize_groups
+        updates = 0
+        
+        # Name/group texts repeat across a playlist; detect each distinct one once
+        detected_countries: Dict[str, Optional[str]] = {}
+        detected_qualities: Dict[str, Optional[str]] = {}
+        MISSING = object()
         
         for channel in channels:
-            updated_channel = ParsedChannel(
-                name=channel.name,
-                url=channel.url,
-                group=channel.group,
-                logo=channel.logo,
-                epg_id=channel.epg_id,
-                country=channel.country,
-                language=channel.language,
-                quality=channel.quality,
-                duration=channel.duration,
-                attributes=channel.attributes.copy() if channel.attributes else {}
-            )
+            country = channel.country
+            quality = channel.quality
+            group = channel.group
+            
+            text = f"{channel.name} {channel.group}"
             
             # Auto-detect country
-            if self.config.auto_detect_countries and not updated_channel.country:
-                detected_country = self._detect_country_from_text(f"{channel.name} {channel.group}")
+            if detect_countries and not country:
+                detected_country = detected_countries.get(text, MISSING)
+                if detected_country is MISSING:
+                    detected_country = detected_countries[text] = self._detect_country_from_text(text)
                 if detected_country:
-                    updated_channel.country = detected_country
-                    self.stats.categorization_updates += 1
+                    country = detected_country
+                    updates += 1
             
             # Auto-detect quality
-            if self.config.auto_detect_quality and not updated_channel.quality:
-                detected_quality = self._detect_quality_from_text(f"{channel.name} {channel.group}")
+            if detect_quality and not quality:
+                detected_quality = detected_qualities.get(text, MISSING)
+                if detected_quality is MISSING:
+                    detected_quality = detected_qualities[text] = self._detect_quality_from_text(text)
                 if detected_quality:
-                    updated_channel.quality = detected_quality
+                    quality = detected_quality
             
             # Update group based on country if enabled
-            if self.config.normalize_groups and updated_channel.country:
-                if updated_channel.group in ['General', 'Uncategorized', '']:
-                    updated_channel.group = self._get_country_group_name(updated_channel.country)
-                    self.stats.categorization_updates += 1
+            if normalize_groups and country:
+                if group in ('General', 'Uncategorized', ''):
+                    group = self._get_country_group_name(country)
+                    updates += 1
             
-            categorized.append(updated_channel)
+            # Copy the channel only if categorization changed something
+            if (country, quality, group) != (channel.country, channel.quality, channel.group):
+                channel = replace(channel, country=country, quality=quality, group=group)
+            categorized.append(channel)
         
+        self.stats.categorization_updates += updates
         self.logger.info(f"Applied {self.stats.categorization_updates} categorization updates")
         return categorized
     
@@ -392,21 +581,19 @@ class UniversalM3UProcessor:
         
         self.logger.info(f"Testing connectivity for {len(channels)} channels...")
         
-        # Limit concurrent tests
-        semaphore = asyncio.Semaphore(self.config.max_concurrent_tests)
+        session = await self._ensure_http()
+        semaphore = self._probe_sem
         accessible_channels = []
         
         async def test_channel(channel):
             async with semaphore:
                 try:
-                    timeout = aiohttp.ClientTimeout(total=self.config.timeout_seconds)
-                    async with aiohttp.ClientSession(timeout=timeout) as session:
-                        async with session.head(channel.url, allow_redirects=True) as response:
-                            if 200 <= response.status < 400:
-                                return channel
-                            else:
-                                self.logger.debug(f"Channel inaccessible: {channel.name} (Status: {response.status})")
-                                return None
+                    async with session.head(channel.url, allow_redirects=True) as response:
+                        if 200 <= response.status < 400:
+                            return channel
+                        else:
+                            self.logger.debug(f"Channel inaccessible: {channel.name} (Status: {response.status})")
+                            return None
                 except Exception as e:
                     self.logger.debug(f"Channel test failed: {channel.name} ({e})")
                     return None
@@ -425,6 +612,31 @@ class UniversalM3UProcessor:
         
         return accessible_channels
     
+    async def _ensure_http(self) -> aiohttp.ClientSession:
+        """Return the shared probe session, creating it (and its semaphore) on first use"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._http_loop is not loop:
+            # One pooled session for the processor's lifetime, so connections
+            # and DNS lookups are reused across runs
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_concurrent_tests,
+                limit_per_host=8,
+                ttl_dns_cache=300
+            )
+            timeout = aiohttp.ClientTimeout(total=self.config.timeout_seconds)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            self._probe_sem = asyncio.Semaphore(self.config.max_concurrent_tests)
+            self._http_loop = loop
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared probe session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._probe_sem = None
+            self._http_loop = None
+    
     async def _generate_output(self):
         """Generate output file in specified format"""
         if not self.processed_channels:
@@ -445,38 +657,39 @@ class UniversalM3UProcessor:
         self.logger.info(f"Output written to {output_path}")
     
     async def _write_m3u_file(self, channels: List[ParsedChannel], output_path: str):
-        """Write channels to M3U format"""
-        lines = ["#EXTM3U"]
+        """Write channels to M3U format, streamed through a large write buffer (in a worker thread, off the event loop)"""
+        await asyncio.to_thread(self._write_m3u_file_sync, channels, output_path)
+    
+    def _write_m3u_file_sync(self, channels: List[ParsedChannel], output_path: str):
+        """Blocking body of _write_m3u_file"""
+        # Write next to the target and swap it in, so a crash mid-write never
+        # leaves a truncated playlist behind
+        tmp_path = output_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.writelines(self._iter_m3u_lines(channels))
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    @staticmethod
+    def _iter_m3u_lines(channels: List[ParsedChannel]):
+        """Yield the M3U text piece by piece, newline-separated with no trailing newline"""
+        yield "#EXTM3U"
         
         for channel in channels:
-            # Build EXTINF line
-            extinf_parts = ["#EXTINF:-1"]
-            
-            # Add attributes
-            if channel.epg_id:
-                extinf_parts.append(f'tvg-id="{channel.epg_id}"')
-            if channel.logo:
-                extinf_parts.append(f'tvg-logo="{channel.logo}"')
-            if channel.group and channel.group != 'General':
-                extinf_parts.append(f'group-title="{channel.group}"')
-            if channel.country:
-                extinf_parts.append(f'tvg-country="{channel.country}"')
-            if channel.language:
-                extinf_parts.append(f'tvg-language="{channel.language}"')
-            
-            # Add name
-            extinf_line = " ".join(extinf_parts) + f",{channel.name}"
-            
-            lines.append(extinf_line)
-            lines.append(channel.url)
-        
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+            yield f"\n{channel.extinf_line()}\n{channel.url}"
     
     async def _write_json_file(self, channels: List[ParsedChannel], output_path: str):
-        """Write channels to JSON format"""
-        channel_dicts = [asdict(channel) for channel in channels]
+        """Write channels to JSON format (in a worker thread, off the event loop)"""
+        await asyncio.to_thread(self._write_json_file_sync, channels, output_path)
+    
+    def _write_json_file_sync(self, channels: List[ParsedChannel], output_path: str):
+        """Blocking body of _write_json_file"""
+        channel_to_dict = self._channel_to_dict
+        channel_dicts = [channel_to_dict(channel) for channel in channels]
         
         output_data = {
             "metadata": {
@@ -488,11 +701,41 @@ class UniversalM3UProcessor:
             "channels": channel_dicts
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        self._dump_json(output_data, output_path)
+    
+    @staticmethod
+    def _channel_to_dict(channel: ParsedChannel) -> Dict:
+        """Flat equivalent of asdict(channel), without its recursive deep copy"""
+        return {
+            'name': channel.name,
+            'url': channel.url,
+            'group': channel.group,
+            'logo': channel.logo,
+            'epg_id': channel.epg_id,
+            'country': channel.country,
+            'language': channel.language,
+            'quality': channel.quality,
+            'duration': channel.duration,
+            'attributes': channel.attributes
+        }
+    
+    @staticmethod
+    def _dump_json(data, output_path: str):
+        """Write data as indented UTF-8 JSON"""
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        with open(output_path, 'wb') as f:
+            f.write(payload)
     
     async def _write_csv_file(self, channels: List[ParsedChannel], output_path: str):
-        """Write channels to CSV format"""
+        """Write channels to CSV format (in a worker thread, off the event loop)"""
+        await asyncio.to_thread(self._write_csv_file_sync, channels, output_path)
+    
+    def _write_csv_file_sync(self, channels: List[ParsedChannel], output_path: str):
+        """Blocking body of _write_csv_file"""
         import csv
         
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
@@ -513,7 +756,11 @@ class UniversalM3UProcessor:
                 })
     
     async def _write_txt_file(self, channels: List[ParsedChannel], output_path: str):
-        """Write channels to simple text format"""
+        """Write channels to simple text format (in a worker thread, off the event loop)"""
+        await asyncio.to_thread(self._write_txt_file_sync, channels, output_path)
+    
+    def _write_txt_file_sync(self, channels: List[ParsedChannel], output_path: str):
+        """Blocking body of _write_txt_file"""
         lines = []
         
         for channel in channels:
@@ -550,8 +797,7 @@ class UniversalM3UProcessor:
         
         # Write report
         report_path = self.config.output_file.replace('.m3u', '_stats.json')
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        await asyncio.to_thread(self._dump_json, report_data, report_path)
         
         self.logger.info(f"Statistics report written to {report_path}")
     
@@ -559,23 +805,36 @@ class UniversalM3UProcessor:
         """Create backup of input file"""
         import shutil
         backup_path = f"{input_file}.backup.{int(time.time())}"
+        
+        # Opt-in: a hard link snapshots the input in O(1) but shares its inode,
+        # so it only stays a backup while nothing rewrites the playlist in place
+        if self.config.backup_hardlink:
+            try:
+                os.link(input_file, backup_path)
+                self.logger.info(f"Backup created: {backup_path}")
+                return
+            except OSError:
+                pass
+        
         shutil.copy2(input_file, backup_path)
         self.logger.info(f"Backup created: {backup_path}")
     
-    def _fix_encoding_issues(self, content: str) -> str:
-        """Fix common encoding issues"""
-        # Handle BOM
-        if content.startswith('\ufeff'):
-            content = content[1:]
-            self.stats.encoding_fixes += 1
-        
-        # Normalize Unicode
-        content = unicodedata.normalize('NFC', content)
-        
-        # Fix line endings
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
-        
-        return content
+    def _fix_encoding_issues(self, lines: Iterable[str]) -> Iterator[str]:
+        """Fix common encoding issues line by line (line endings are left to text-mode reads)"""
+        first = True
+        for line in lines:
+            # Handle BOM
+            if first:
+                first = False
+                if line.startswith('\ufeff'):
+                    line = line[1:]
+                    self.stats.encoding_fixes += 1
+            
+            # Normalize Unicode (ASCII text is already NFC)
+            if not line.isascii():
+                line = unicodedata.normalize('NFC', line)
+            
+            yield line
     
     def _is_channel_valid_for_import(self, channel: ParsedChannel) -> bool:
         """Check if channel is valid for import"""
@@ -590,16 +849,16 @@ class UniversalM3UProcessor:
         if name_len < self.config.min_name_length or name_len > self.config.max_name_length:
             return False
         
-        # Check URL protocol
-        url_lower = channel.url.lower()
-        if not any(url_lower.startswith(protocol) for protocol in self.config.required_protocols):
+        # Check URL protocol (one startswith over the whole tuple, in C)
+        if not channel.url.lower().startswith(tuple(self.config.required_protocols)):
             self.stats.invalid_urls += 1
             return False
         
         # Check blocked domains
-        parsed_url = urlparse(channel.url)
-        if any(blocked in parsed_url.netloc.lower() for blocked in self.config.blocked_domains):
-            return False
+        netloc = self._parse_url(channel.url).netloc.lower()
+        for blocked in self.config.blocked_domains:
+            if blocked in netloc:
+                return False
         
         return True
     
@@ -616,19 +875,21 @@ class UniversalM3UProcessor:
         if not name:
             return "Unnamed Channel"
         
-        # Remove EXTINF artifacts
-        name = re.sub(r'tvg-[^=]*="[^"]*"', '', name)
-        name = re.sub(r'group-title="[^"]*"', '', name)
-        name = re.sub(r'radio="[^"]*"', '', name)
+        # Remove EXTINF artifacts (all of them contain '="')
+        if '="' in name:
+            name = TVG_ATTR_PATTERN.sub('', name)
+            name = GROUP_TITLE_ATTR_PATTERN.sub('', name)
+            name = RADIO_ATTR_PATTERN.sub('', name)
         
         # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
+        name = ' '.join(name.split())
         
         # Remove leading/trailing punctuation
         name = name.strip('.,;:-_|')
         
         # Remove HTML entities
-        name = re.sub(r'&[a-zA-Z0-9#]+;', '', name)
+        if '&' in name:
+            name = HTML_ENTITY_PATTERN.sub('', name)
         
         if not name:
             return "Unnamed Channel"
@@ -644,7 +905,7 @@ class UniversalM3UProcessor:
         url = url.strip()
         
         # Remove common URL artifacts
-        url = re.sub(r'\s+', '', url)  # Remove any whitespace
+        url = ''.join(url.split())  # Remove any whitespace
         
         return url
     
@@ -661,21 +922,7 @@ class UniversalM3UProcessor:
             group = group[1:-1]
         
         # Normalize common group names
-        group_lower = group.lower()
-        if group_lower in ['entertainment', 'general', 'misc', 'other']:
-            return "Entertainment"
-        elif group_lower in ['news', 'news & politics']:
-            return "News"
-        elif group_lower in ['sports', 'sport']:
-            return "Sports"
-        elif group_lower in ['movies', 'films', 'cinema']:
-            return "Movies"
-        elif group_lower in ['kids', 'children', 'cartoon']:
-            return "Kids"
-        elif group_lower in ['music', 'audio']:
-            return "Music"
-        
-        return group if group else "General"
+        return GROUP_CANON.get(group.lower(), group or "General")
     
     def _clean_logo_url(self, logo: str) -> str:
         """Clean and validate logo URL"""
@@ -698,7 +945,7 @@ class UniversalM3UProcessor:
         epg_id = epg_id.strip()
         
         # Remove spaces (EPG IDs shouldn't have spaces)
-        epg_id = re.sub(r'\s+', '', epg_id)
+        epg_id = ''.join(epg_id.split())
         
         # Validate length (reasonable EPG ID length)
         if len(epg_id) > 100:
@@ -706,98 +953,69 @@ class UniversalM3UProcessor:
         
         return epg_id
     
-    def _generate_channel_signature(self, channel: ParsedChannel) -> str:
-        """Generate signature for duplicate detection"""
+    def _parse_url(self, url: str) -> ParseResult:
+        """urlparse() with a per-run cache"""
+        parsed = self._parsed_urls.get(url)
+        if parsed is None:
+            parsed = self._parsed_urls[url] = urlparse(url)
+        return parsed
+    
+    def _generate_channel_signature(self, channel: ParsedChannel) -> Union[str, Tuple[str, ...]]:
+        """Generate signature for duplicate detection (the normalized key itself, hashed by the set)"""
         if self.config.duplicate_detection_method == "url_exact":
-            return hashlib.md5(channel.url.lower().encode()).hexdigest()
+            return channel.url.lower()
         elif self.config.duplicate_detection_method == "url_similarity":
             # Normalize URL for similarity comparison
+            if channel.url.isascii():
+                # ASCII lowercasing can't move URL delimiters, so lowering the
+                # cached parse equals parsing the lowered URL
+                parsed = self._parse_url(channel.url)
+                return (parsed.scheme, parsed.netloc.lower(), parsed.path.lower())
             parsed = urlparse(channel.url.lower())
-            normalized_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-            return hashlib.md5(normalized_url.encode()).hexdigest()
-        elif self.config.duplicate_detection_method == "name_similarity":
+            return (parsed.scheme, parsed.netloc, parsed.path)
+        elif self.config.duplicate_detection_method in ("name_similarity", "name_fuzzy"):
             # Normalize name for comparison
-            normalized_name = re.sub(r'[^\w\s]', '', channel.name.lower())
-            normalized_name = re.sub(r'\s+', ' ', normalized_name).strip()
-            return hashlib.md5(normalized_name.encode()).hexdigest()
+            normalized_name = NON_WORD_PATTERN.sub('', channel.name.lower())
+            return ' '.join(normalized_name.split())
         else:  # metadata combination
-            signature_text = f"{channel.name.lower()}|{channel.url.lower()}|{channel.group.lower()}"
-            return hashlib.md5(signature_text.encode()).hexdigest()
+            return (channel.name.lower(), channel.url.lower(), channel.group.lower())
     
     def _detect_country_from_text(self, text: str) -> Optional[str]:
         """Detect country code from text"""
-        text_lower = text.lower()
-        
-        # Load country patterns if not loaded
-        if not hasattr(self, 'country_patterns') or not self.country_patterns:
-            self.country_patterns = self._load_country_patterns()
-        
-        for country_code, patterns in self.country_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    return country_code
-        
-        return None
+        return _match_keyword_sets(text, self._country_keywords)
     
     def _detect_quality_from_text(self, text: str) -> Optional[str]:
         """Detect quality level from text"""
-        text_lower = text.lower()
-        
-        # Load quality patterns if not loaded
-        if not hasattr(self, 'quality_patterns') or not self.quality_patterns:
-            self.quality_patterns = self._load_quality_patterns()
-        
-        for quality, patterns in self.quality_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    return quality
-        
-        return None
+        return _match_keyword_sets(text, self._quality_keywords)
     
     def _get_country_group_name(self, country_code: str) -> str:
         """Get group name for country"""
-        country_names = {
-            'US': 'USA', 'UK': 'United Kingdom', 'CA': 'Canada', 'AU': 'Australia',
-            'DE': 'Germany', 'FR': 'France', 'IT': 'Italy', 'ES': 'Spain',
-            'BR': 'Brazil', 'IN': 'India', 'CN': 'China', 'JP': 'Japan',
-            'KR': 'South Korea', 'RU': 'Russia', 'TR': 'Turkey', 'AR': 'Argentina',
-            'MX': 'Mexico', 'NL': 'Netherlands', 'SE': 'Sweden', 'NO': 'Norway',
-            'DK': 'Denmark', 'FI': 'Finland', 'BE': 'Belgium', 'CH': 'Switzerland',
-            'AT': 'Austria', 'PT': 'Portugal', 'GR': 'Greece', 'PL': 'Poland'
-        }
-        return country_names.get(country_code, country_code)
+        return COUNTRY_GROUP_NAMES.get(country_code, country_code)
     
     def _analyze_by_group(self) -> Dict[str, int]:
         """Analyze channels by group"""
-        groups = {}
-        for channel in self.processed_channels:
-            group = channel.group or 'Uncategorized'
-            groups[group] = groups.get(group, 0) + 1
-        return dict(sorted(groups.items(), key=lambda x: x[1], reverse=True))
+        groups = Counter(channel.group or 'Uncategorized' for channel in self.processed_channels)
+        return dict(groups.most_common())
     
     def _analyze_by_country(self) -> Dict[str, int]:
         """Analyze channels by country"""
-        countries = {}
-        for channel in self.processed_channels:
-            country = channel.country or 'Unknown'
-            countries[country] = countries.get(country, 0) + 1
-        return dict(sorted(countries.items(), key=lambda x: x[1], reverse=True))
+        countries = Counter(channel.country or 'Unknown' for channel in self.processed_channels)
+        return dict(countries.most_common())
     
     def _analyze_by_quality(self) -> Dict[str, int]:
         """Analyze channels by quality"""
-        qualities = {}
-        for channel in self.processed_channels:
-            quality = channel.quality or 'Unknown'
-            qualities[quality] = qualities.get(quality, 0) + 1
-        return dict(sorted(qualities.items(), key=lambda x: x[1], reverse=True))
+        qualities = Counter(channel.quality or 'Unknown' for channel in self.processed_channels)
+        return dict(qualities.most_common())
     
     def _analyze_url_protocols(self) -> Dict[str, int]:
         """Analyze URL protocols used"""
         protocols = {}
         for channel in self.processed_channels:
             if channel.url:
-                parsed = urlparse(channel.url)
-                protocol = parsed.scheme.lower()
+                # Only the scheme is needed; match urlparse's rule for it
+                # directly instead of parsing the whole URL
+                match = URL_SCHEME_PATTERN.match(channel.url)
+                protocol = match.group(1).lower() if match else ''
                 protocols[protocol] = protocols.get(protocol, 0) + 1
         return dict(sorted(protocols.items(), key=lambda x: x[1], reverse=True))
     
@@ -872,6 +1090,7 @@ class M3UProcessorCLI:
                           default='full', help='Processing mode')
         parser.add_argument('--format', choices=['m3u', 'json', 'csv', 'txt'], default='m3u', help='Output format')
         parser.add_argument('--no-backup', action='store_true', help='Skip creating backup')
+        parser.add_argument('--hardlink-backup', action='store_true', help='Back up with a hard link instead of a full copy')
         parser.add_argument('--strict', action='store_true', help='Enable strict validation')
         parser.add_argument('--test-connectivity', action='store_true', help='Test stream connectivity')
         parser.add_argument('--no-duplicates', action='store_true', help='Skip duplicate removal')
@@ -892,6 +1111,7 @@ class M3UProcessorCLI:
             output_file=args.output,
             output_format=args.format,
             backup_enabled=not args.no_backup,
+            backup_hardlink=args.hardlink_backup,
             strict_validation=args.strict,
             test_stream_health=args.test_connectivity,
             remove_duplicates=not args.no_duplicates,
@@ -935,6 +1155,8 @@ class M3UProcessorCLI:
         except Exception as e:
             print(f"Error: {e}")
             return 1
+        finally:
+            await self.processor.aclose()
         
         return 0
 
@@ -985,16 +1207,5 @@ async def main():
 
 if __name__ == "__main__":
     import sys
-    from enum import Enum
-    
-    # Define ProcessingMode enum here since it's used in main
-    class ProcessingMode(Enum):
-        IMPORT = "import"
-        CLEAN = "clean"
-        VALIDATE = "validate"
-        DEDUPLICATE = "deduplicate"
-        CATEGORIZE = "categorize"
-        EXPORT = "export"
-        FULL_PIPELINE = "full_pipeline"
     
     sys.exit(asyncio.run(main()))
\ No newline at end of file
@@ -6,9 +6,123 @@ Common utility functions for M3U processing
 
 import re
 import os
+import logging
 import requests
 from urllib.parse import urlparse
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Concurrent validation lives in modules/helper; re-exported here for utils callers
+try:
+    from .modules.helper import validate_urls
+except ImportError:
+    from modules.helper import validate_urls
+
+
+LOGO_MAP = {
+    'cnn': 'https://upload.wikimedia.org/wikipedia/commons/b/b1/CNN.svg',
+    'bbc': 'https://upload.wikimedia.org/wikipedia/commons/6/62/BBC_News_2019.svg',
+    'fox': 'https://upload.wikimedia.org/wikipedia/commons/6/67/Fox_News_Channel_logo.svg',
+    'espn': 'https://upload.wikimedia.org/wikipedia/commons/2/2f/ESPN_wordmark.svg',
+    'discovery': 'https://upload.wikimedia.org/wikipedia/commons/2/27/Discovery_Channel_logo.svg',
+    'history': 'https://logos-world.net/wp-content/uploads/2020/06/History-Channel-Logo.png',
+    'national geographic': 'https://logos-world.net/wp-content/uploads/2020/09/National-Geographic-Logo.png',
+    'disney': 'https://logos-world.net/wp-content/uploads/2020/05/Disney-Channel-Logo-2014-2019.png'
+}
+
+EPG_MAP = {
+    'cnn international': 'cnn.international',
+    'cnn': 'cnn.us',
+    'bbc world news': 'bbc.world.news',
+    'bbc news': 'bbc.news.uk',
+    'bbc one': 'bbc.one.uk',
+    'fox news': 'fox.news.us',
+    'espn': 'espn.us',
+    'discovery channel': 'discovery.channel',
+    'history channel': 'history.us',
+    'national geographic': 'nat.geo.us',
+    'disney channel': 'disney.channel.us',
+    'sky news': 'sky.news.uk',
+    'al jazeera': 'aljazeera.english'
+}
+
+COUNTRY_KEYWORDS = {
+    'US': ['cnn', 'fox', 'nbc', 'abc', 'usa'],
+    'GB': ['bbc', 'itv', 'sky', 'uk'],
+    'FR': ['france', 'tf1'],
+    'DE': ['deutschland', 'ard', 'zdf']
+}
+
+
+def _build_keyword_automaton(keyword_values):
+    """Aho-Corasick automaton over (keyword, value) pairs; each word maps to (rank, value), first listing wins"""
+    automaton = ahocorasick.Automaton()
+    for rank, (keyword, value) in enumerate(keyword_values):
+        if keyword not in automaton:
+            automaton.add_word(keyword, (rank, value))
+    automaton.make_automaton()
+    return automaton
+
+
+def _first_keyword_value(text, automaton, keyword_values):
+    """
+    Value of the earliest-listed keyword found anywhere in text, or None
+    
+    Matches the linear "for keyword in map: if keyword in text" scan; the
+    automaton finds every keyword in one pass and the lowest rank wins.
+    """
+    if automaton is None:
+        for keyword, value in keyword_values:
+            if keyword in text:
+                return value
+        return None
+    
+    best_rank = len(keyword_values)
+    best_value = None
+    for _, (rank, value) in automaton.iter(text):
+        if rank < best_rank:
+            best_rank, best_value = rank, value
+            if not rank:
+                break
+    return best_value
+
+
+LOGO_KEYWORDS = list(LOGO_MAP.items())
+EPG_KEYWORDS = list(EPG_MAP.items())
+COUNTRY_KEYWORD_CODES = [(keyword, code) for code, keywords in COUNTRY_KEYWORDS.items() for keyword in keywords]
+
+if ahocorasick is not None:
+    LOGO_AUTOMATON = _build_keyword_automaton(LOGO_KEYWORDS)
+    EPG_AUTOMATON = _build_keyword_automaton(EPG_KEYWORDS)
+    COUNTRY_AUTOMATON = _build_keyword_automaton(COUNTRY_KEYWORD_CODES)
+else:
+    LOGO_AUTOMATON = EPG_AUTOMATON = COUNTRY_AUTOMATON = None
+
+
+_file_logger = None
+
+# One pooled session so repeated validate_url calls reuse connections
+_http_session = requests.Session()
+
+
+def _get_file_logger():
+    """Logger writing bare lines to logs/processing.log, set up on first use"""
+    global _file_logger
+    if _file_logger is None:
+        # Ensure logs directory exists
+        os.makedirs("logs", exist_ok=True)
+        handler = logging.FileHandler("logs/processing.log", encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger = logging.getLogger("m3u_utils")
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        logger.propagate = False
+        _file_logger = logger
+    return _file_logger
+
 
 def log(message, level="INFO"):
     """Enhanced logging function"""
@@ -17,10 +131,8 @@ def log(message, level="INFO"):
     log_message = f"[{timestamp}] [{level}] {message}"
     print(log_message)
     
-    # Ensure logs directory exists
-    os.makedirs("logs", exist_ok=True)
-    with open("logs/processing.log", "a", encoding="utf-8") as f:
-        f.write(log_message + "\n")
+    # The file stays open across calls instead of being reopened per message
+    _get_file_logger().info(log_message)
 
 
 def normalize_name(name):
@@ -32,49 +144,15 @@ def normalize_name(name):
 
 def get_logo_from_name(channel_name):
     """Generate logo URL from channel name"""
-    name_lower = channel_name.lower()
-    
-    logo_map = {
-        'cnn': 'https://upload.wikimedia.org/wikipedia/commons/b/b1/CNN.svg',
-        'bbc': 'https://upload.wikimedia.org/wikipedia/commons/6/62/BBC_News_2019.svg',
-        'fox': 'https://upload.wikimedia.org/wikipedia/commons/6/67/Fox_News_Channel_logo.svg',
-        'espn': 'https://upload.wikimedia.org/wikipedia/commons/2/2f/ESPN_wordmark.svg',
-        'discovery': 'https://upload.wikimedia.org/wikipedia/commons/2/27/Discovery_Channel_logo.svg',
-        'history': 'https://logos-world.net/wp-content/uploads/2020/06/History-Channel-Logo.png',
-        'national geographic': 'https://logos-world.net/wp-content/uploads/2020/09/National-Geographic-Logo.png',
-        'disney': 'https://logos-world.net/wp-content/uploads/2020/05/Disney-Channel-Logo-2014-2019.png'
-    }
-    
-    for key, logo in logo_map.items():
-        if key in name_lower:
-            return logo
-    
-    return ""
+    logo = _first_keyword_value(channel_name.lower(), LOGO_AUTOMATON, LOGO_KEYWORDS)
+    return logo if logo is not None else ""
 
 
 def get_epg_id(channel_name):
     """Generate EPG ID from channel name"""
-    name_lower = channel_name.lower()
-    
-    epg_map = {
-        'cnn international': 'cnn.international',
-        'cnn': 'cnn.us',
-        'bbc world news': 'bbc.world.news',
-        'bbc news': 'bbc.news.uk',
-        'bbc one': 'bbc.one.uk',
-        'fox news': 'fox.news.us',
-        'espn': 'espn.us',
-        'discovery channel': 'discovery.channel',
-        'history channel': 'history.us',
-        'national geographic': 'nat.geo.us',
-        'disney channel': 'disney.channel.us',
-        'sky news': 'sky.news.uk',
-        'al jazeera': 'aljazeera.english'
-    }
-    
-    for key, epg_id in epg_map.items():
-        if key in name_lower:
-            return epg_id
+    epg_id = _first_keyword_value(channel_name.lower(), EPG_AUTOMATON, EPG_KEYWORDS)
+    if epg_id is not None:
+        return epg_id
     
     clean_name = normalize_name(channel_name)
     return clean_name.replace(' ', '.')
@@ -82,24 +160,14 @@ def get_epg_id(channel_name):
 
 def detect_country_from_name(name):
     """Detect country from channel name"""
-    name_lower = name.lower()
-    
-    if any(x in name_lower for x in ['cnn', 'fox', 'nbc', 'abc', 'usa']):
-        return 'US'
-    elif any(x in name_lower for x in ['bbc', 'itv', 'sky', 'uk']):
-        return 'GB'
-    elif any(x in name_lower for x in ['france', 'tf1']):
-        return 'FR'
-    elif any(x in name_lower for x in ['deutschland', 'ard', 'zdf']):
-        return 'DE'
-    
-    return 'Unknown'
+    country = _first_keyword_value(name.lower(), COUNTRY_AUTOMATON, COUNTRY_KEYWORD_CODES)
+    return country if country is not None else 'Unknown'
 
 
 def validate_url(url):
     """Validate if URL is accessible"""
     try:
-        response = requests.head(url, timeout=10)
+        response = _http_session.head(url, timeout=10)
         return response.status_code == 200
-    except:
+    except requests.RequestException:
         return False